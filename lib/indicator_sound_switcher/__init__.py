@@ -29,23 +29,27 @@ import tempfile
 import fcntl
 import gettext
 
-from .indicator import SoundSwitcherIndicator, APP_ID, APP_NAME, APP_VERSION
+from .startup import profiler
+
+with profiler.phase('import'):
+    from .indicator import SoundSwitcherIndicator, APP_ID, APP_NAME, APP_VERSION
 
 
 def _parse_cmd_line():
-    """Parse command line arguments. Currently only sets up logging."""
+    """Parse command line arguments. Sets up logging and startup profiling."""
     # Check command line arguments
-    lvl = logging.WARNING
+    lvl = None
     for arg in sys.argv:
-        if arg == '-v':
+        if arg == '-v' and lvl is None:
             lvl = logging.INFO
-            break
-        elif arg == '-vv':
+        elif arg == '-vv' and lvl is None:
             lvl = logging.DEBUG
-            break
+        elif arg == '--profile-startup' or arg.startswith('--profile-startup='):
+            profiler.enabled   = True
+            profiler.file_name = arg.partition('=')[2] or None
 
     # Set up logging options
-    logging.basicConfig(level=lvl, format='%(levelname)-8s %(message)s')
+    logging.basicConfig(level=lvl or logging.WARNING, format='%(levelname)-8s %(message)s')
 
 
 def main():
@@ -63,7 +67,9 @@ def main():
 
         # Instantiate and run the indicator
         logging.info('%s v%s', APP_NAME, APP_VERSION)
-        SoundSwitcherIndicator().run()
+        with profiler.phase('indicator init'):
+            indicator = SoundSwitcherIndicator()
+        indicator.run()
 
     except OSError:
         logging.info('%s is already running, exiting', APP_NAME)
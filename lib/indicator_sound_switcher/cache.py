@@ -0,0 +1,80 @@
+"""
+Persistent cache of the indicator menu.
+"""
+import json
+import logging
+import os
+
+
+class MenuCache:
+    """Snapshot of the port items of the indicator menu, persisted between sessions so that the menu can be shown right
+    after startup, before the PulseAudio daemon has answered.
+
+    Every entry is a dict describing a single port item:
+      key:    list of [kind, owner name, port name], kind being either 'card', 'sink' or 'source'
+      output: whether it's an output port
+      label:  menu item title
+      show:   whether the item is visible
+      active: whether the port is the active one
+    """
+
+    # Format version of the cache file; files of other versions are ignored
+    VERSION = 1
+
+    def __init__(self, file_name: str):
+        """Constructor.
+        :param file_name: name of the JSON cache file
+        """
+        self.file_name = file_name
+        # -- JSON text last read from or written to the file, used to skip writing an unchanged snapshot
+        self._text     = None
+
+    def load(self) -> list:
+        """Read the cached entries from the file.
+        :return: list of entry dicts (empty if there's no valid cache)
+        """
+        try:
+            with open(self.file_name, 'r') as f:
+                text = f.read()
+            data = json.loads(text)
+            if data.get('version') != self.VERSION:
+                logging.info('Menu cache %s has an unsupported version, ignoring it', self.file_name)
+                return []
+            entries = [
+                e for e in data['entries']
+                if isinstance(e.get('key'), list) and len(e['key']) == 3 and isinstance(e.get('label'), str)]
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logging.warning('Failed to read menu cache %s: %s', self.file_name, e)
+            return []
+
+        self._text = text
+        logging.info('Loaded %d item(s) from menu cache %s', len(entries), self.file_name)
+        return entries
+
+    def save(self, entries: list) -> bool:
+        """Write the given entries to the file, unless they're the same as the ones last read or written.
+        :param entries: list of entry dicts
+        :return: whether the file has been written
+        """
+        text = json.dumps(
+            {'version': self.VERSION, 'entries': sorted(entries, key=lambda e: e['key'])},
+            indent=1, ensure_ascii=False)
+        if text == self._text:
+            return False
+
+        # Write a temporary file and then replace the cache, so that it's never left half-written
+        tmp_name = self.file_name + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.file_name), exist_ok=True)
+            with open(tmp_name, 'w') as f:
+                f.write(text)
+            os.replace(tmp_name, self.file_name)
+        except OSError as e:
+            logging.warning('Failed to write menu cache %s: %s', self.file_name, e)
+            return False
+
+        self._text = text
+        logging.debug('.cache: saved %d item(s) to %s', len(entries), self.file_name)
+        return True
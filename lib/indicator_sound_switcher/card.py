@@ -1,5 +1,12 @@
+from collections import namedtuple
+
 from gi.repository import GObject
-from . import lib_pulseaudio
+
+# Profiles supporting a card port:
+#   preferred: the profile configured as preferred for the port, if any and if the port supports it, otherwise None
+#   best:      the supported profile with the highest priority, None if the port isn't supported by any profile
+#   supported: set of names of all profiles supporting the port
+PortProfiles = namedtuple('PortProfiles', 'preferred best supported')
 
 
 class CardProfile(GObject.GObject):
@@ -23,7 +30,7 @@ class CardProfile(GObject.GObject):
 class Card(GObject.GObject):
     """Card class."""
 
-    def __init__(self, index: int, name: str, display_name: str, driver: str, profiles: dict, ports: dict, proplist):
+    def __init__(self, index: int, name: str, display_name: str, driver: str, profiles: dict, ports: dict, properties):
         """Constructor.
         :param index:         Index of the card, as provided by PulseAudio
         :param name:          (Internal) name of the card, as provided by PulseAudio
@@ -31,7 +38,7 @@ class Card(GObject.GObject):
         :param driver:        Name of the driver used
         :param profiles:      Dictionary of CardProfile objects, indexed by profile name
         :param ports:         Dictionary of Port objects, indexed by port name
-        :param proplist:      Property list, a PulseAudio's pa_proplist structure
+        :param properties:    Dictionary of card property values, indexed by property name
         """
         GObject.GObject.__init__(self)
         self.index        = index
@@ -40,7 +47,7 @@ class Card(GObject.GObject):
         self.driver       = driver
         self.profiles     = profiles
         self.ports        = ports
-        self.proplist     = proplist
+        self.properties   = properties
 
         # Initialise derived properties
         self.description  = self.get_property_str("device.description")
@@ -51,23 +58,17 @@ class Card(GObject.GObject):
         for port in self.ports.values():
             port.owner_card = self
 
-    def find_stream_port(self, card_port, sources: dict, sinks: dict):
+        # -- Profiles supporting each port: port name => PortProfiles
+        self.port_profiles = {}
+        self.update_port_profiles()
+
+    def find_stream_port(self, card_port, stream_ports) -> tuple:
         """Try to find a sink/source port that corresponds to the given card port, belonging to this card.
         :param card_port: Card port to find a matching port for
-        :param sources: List of all sources to search in case the port is an input
-        :param sinks: List of all sinks to search in case the port is an output
+        :param stream_ports: StreamPortIndex of all sinks and sources
         :returns tuple containing stream (or None) and its port (or None)
         """
-        # Try to find a sink/source for this card (by matching card index)
-        streams = sinks if card_port.is_output else sources
-        for stream in streams.values():
-            if stream.card_index == self.index:
-                # Found a potential stream. Now try to find a corresponding stream's port (with the matching port name).
-                if card_port.name in stream.ports:
-                    return stream, stream.ports[card_port.name]
-
-        # No luck
-        return None, None
+        return stream_ports.lookup(self.index, card_port.direction, card_port.name)
 
     def get_active_profile(self):
         """Returns the currently active profile on the card, if any, otherwise None."""
@@ -78,8 +79,7 @@ class Card(GObject.GObject):
 
     def get_property_str(self, name: str) -> str:
         """Returns value of a property by its name as a string."""
-        v = lib_pulseaudio.pa_proplist_gets(self.proplist, name.encode())
-        return v.decode() if v else _('(none)')
+        return self.properties.get(name) or _('(none)')
 
     def get_display_name(self) -> str:
         """Returns display name for the card."""
@@ -96,18 +96,38 @@ class Card(GObject.GObject):
         # If a suitable port found, return it combined with the description, otherwise just use the description
         return '{} - {}'.format(max_port.description, self.description) if max_port else self.description
 
-    def update_port_activity(self, sources: dict, sinks: dict):
+    def update_port_profiles(self):
+        """(Re)build the table of profiles supporting each port. Must be called whenever the card's profiles or the
+        ports' supported or preferred profiles change."""
+        self.port_profiles = {}
+        for port in self.ports.values():
+            profiles = {name: self.profiles[name] for name in port.profiles or () if name in self.profiles}
+            self.port_profiles[port.name] = PortProfiles(
+                profiles.get(port.pref_profile) if port.pref_profile else None,
+                max(profiles.values(), key=lambda p: p.priority) if profiles else None,
+                frozenset(profiles))
+
+    def update_port_activity(self, stream_ports) -> int:
         """Updates the is_active state of every port on the card, according to the state of the related sink/source
         port, if any.
+        :return: number of ports whose state has actually been updated
         """
+        touched = 0
         for port in self.ports.values():
             # Try to find a sink/source port for this port
-            stream, stream_port = self.find_stream_port(port, sources, sinks)
+            stream, stream_port = self.find_stream_port(port, stream_ports)
 
-            # Update the port object (this will also update the menu item). A port is active if it's mapped to an
-            # active stream and is dummy or its corresponding stream's port is active
-            port.is_active = \
+            # A port is active if it's mapped to an active stream and is dummy or its corresponding stream's port is
+            # active
+            is_active = \
                 stream is not None and \
                 stream.is_active and \
                 stream_port is not None and \
                 (port.is_dummy or stream_port.is_active)
+
+            # Update the port object (this will also update the menu item), unless it's already in the required state
+            # and so is the menu item (which might have been toggled by the user)
+            if port.is_active != is_active or is_active and port.menu_item and not port.menu_item.get_active():
+                port.is_active = is_active
+                touched += 1
+        return touched
@@ -5,9 +5,24 @@ import logging
 import os.path
 import json
 import gi
-gi.require_version('Keybinder', '3.0')
 
-from gi.repository import Keybinder
+from .startup import profiler
+
+# Keybinder module, loaded and initialised on first use, see get_keybinder()
+_keybinder = None
+
+
+def get_keybinder():
+    """Load and initialise Keybinder on first use. It's only needed if there are keyboard shortcuts configured, and it
+    can only be initialised once per process."""
+    global _keybinder
+    if _keybinder is None:
+        with profiler.phase('Keybinder init'):
+            gi.require_version('Keybinder', '3.0')
+            from gi.repository import Keybinder
+            Keybinder.init()
+        _keybinder = Keybinder
+    return _keybinder
 
 
 class Config(dict):
@@ -106,6 +121,59 @@ class Config(dict):
             self[k] = v
 
 
+class ShortcutIndex:
+    """Index of the device ports having a keyboard shortcut configured, which saves scanning the configuration of all
+    devices and ports whenever the shortcuts are to be (re)bound.
+    """
+
+    def __init__(self, config: Config):
+        """Constructor.
+        :param config: Config object to take keyboard shortcuts from
+        """
+        self.shortcuts = {}  # (device_name, port_name) => shortcut
+        self.rebuild(config)
+
+    def __len__(self) -> int:
+        """Number of ports having a shortcut."""
+        return len(self.shortcuts)
+
+    def rebuild(self, config: Config):
+        """Rebuild the index from scratch, e.g. because the configuration has been loaded or pruned.
+        :param config: Config object to take keyboard shortcuts from
+        """
+        self.shortcuts.clear()
+        for device_name, device_cfg in config['devices'].items():
+            for port_name, port_cfg in device_cfg['ports'].items():
+                # Port config can also be a string or False in older configs
+                shortcut = port_cfg['shortcut', None] if type(port_cfg) is Config else None
+                if shortcut:
+                    self.shortcuts[(device_name, port_name)] = shortcut
+        logging.debug('ShortcutIndex.rebuild(): %d shortcut(s) found', len(self.shortcuts))
+
+    def set(self, device_name: str, port_name: str, shortcut):
+        """Update the shortcut of a single port.
+        :param device_name: name of the device
+        :param port_name: name of the port
+        :param shortcut: shortcut to assign, or None to remove it
+        """
+        if shortcut:
+            self.shortcuts[(device_name, port_name)] = shortcut
+        else:
+            self.shortcuts.pop((device_name, port_name), None)
+
+    def get_mappings(self) -> dict:
+        """Return the ports grouped by their shortcuts.
+        :return: dictionary of list of tuples: shortcut => [(device_name, port_name), ...], sorted by device and port
+                 name
+        """
+        mappings = {}
+        for device_port, shortcut in self.shortcuts.items():
+            mappings.setdefault(shortcut, []).append(device_port)
+        for m in mappings.values():
+            m.sort()
+        return mappings
+
+
 class KeyboardManager:
     """Utility class for managing keyboards shortcuts."""
 
@@ -115,12 +183,12 @@ class KeyboardManager:
         """
         self.current_mappings = {}  # Dictionary of list of tuples: shortcut => [(device_name, port_name), ...]
         self.on_port_selected = on_port_selected
-        Keybinder.init()
+        self.keybinder        = get_keybinder()
 
     def _bind_all(self):
         """Bind all key bindings according to the current_mappings."""
         for shortcut, mapping in self.current_mappings.items():
-            if Keybinder.bind(shortcut, self.on_port_selected, mapping):
+            if self.keybinder.bind(shortcut, self.on_port_selected, mapping):
                 logging.debug('  - Bound keyboard shortcut `%s` to `%s`', shortcut, mapping)
             else:
                 logging.warning('Failed to bind keyboard shortcut `%s` to `%s`', shortcut, mapping)
@@ -128,30 +196,19 @@ class KeyboardManager:
     def _unbind_all(self):
         """Unbind all mapped key bindings."""
         for shortcut in self.current_mappings.keys():
-            Keybinder.unbind(shortcut)
+            self.keybinder.unbind(shortcut)
             logging.debug('  - Unbound keyboard shortcut `%s`', shortcut)
 
-    def bind_keys(self, config: Config):
+    def bind_keys(self, shortcuts: ShortcutIndex):
         """Updates key bindings based on the current configuration.
-        :param config: Config object to take keyboard shortcuts from
+        :param shortcuts: ShortcutIndex to take keyboard shortcuts from
         """
         logging.debug('KeyboardManager.bind_keys()')
-        new_mappings = {}
+        new_mappings = shortcuts.get_mappings()
 
-        # Scan all ports of all devices
-        for device_name, device_cfg in config['devices'].items():
-            for port_name, port_cfg in device_cfg['ports'].items():
-                # If there's a shortcut
-                shortcut = port_cfg['shortcut', None]
-                if shortcut:
-                    # Append the tuple to the mapping list for the shortcut
-                    if shortcut not in new_mappings:
-                        new_mappings[shortcut] = []
-                    new_mappings[shortcut].append((device_name, port_name))
-
-        # Sort each list by device and port name
-        for m in new_mappings.values():
-            m.sort()
+        # Nothing to do if the mappings are unchanged
+        if new_mappings == self.current_mappings:
+            return
 
         # (Re)map all mappings
         self._unbind_all()
@@ -0,0 +1,226 @@
+"""
+PulseAudio subscription event handling.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from gi.repository import GLib
+
+from . import lib_pulseaudio
+
+# Default max number of distinct pending events in the event queue; overflowing it results in a full resync
+EVENT_QUEUE_MAX_SIZE = 256
+
+# Default max number of events processed in one go when draining the event queue
+EVENT_QUEUE_BATCH_SIZE = 32
+
+# Default min interval (in milliseconds) between two processed CHANGE events for the same object
+CHANGE_INTERVAL_MS = 200
+
+
+class EventQueue:
+    """Bounded, thread-safe queue collecting PulseAudio subscription events arriving on the PulseAudio thread, which
+    are subsequently drained on the GUI thread by a single GLib source.
+
+    All events pending for the same object (identified by its facility and index) are collapsed into a single one, so
+    that the dispatcher processes each object only once per window, in the order of their latest events. If the queue
+    overflows, all pending events are dropped and replaced by a single resync.
+    """
+
+    def __init__(
+            self, dispatch: callable, resync: callable, window_ms: int, max_size: int = EVENT_QUEUE_MAX_SIZE,
+            batch_size: int = EVENT_QUEUE_BATCH_SIZE):
+        """Constructor.
+        :param dispatch:   callback receiving (facility, kind, index) for every coalesced event, invoked on the GUI
+                           thread
+        :param resync:     callback (re)fetching the complete PulseAudio state, invoked on the GUI thread once the queue
+                           has overflown
+        :param window_ms:  time (in milliseconds) events are collected for before being dispatched. 0 means dispatching
+                           them as soon as the GUI thread is idle
+        :param max_size:   max number of distinct pending events
+        :param batch_size: max number of events processed per main loop iteration
+        """
+        self.dispatch   = dispatch
+        self.resync     = resync
+        self.window_ms  = max(window_ms, 0)
+        self.max_size   = max(max_size, 1)
+        self.batch_size = max(batch_size, 1)
+        # -- Total number of raw events received from PulseAudio
+        self.received   = 0
+        # -- Total number of coalesced events passed on to the dispatcher
+        self.dispatched = 0
+        # -- Total number of queue overflows
+        self.overflows  = 0
+
+        # Pending events in the order of arrival: (facility, index) => kind
+        self._pending   = OrderedDict()
+        self._overflown = False
+        self._source_id = None
+        self._lock      = threading.Lock()
+
+    @staticmethod
+    def merge_kinds(pending_kind, kind: int) -> int:
+        """Combine the kind of a pending event with the kind of a newly arrived event for the same object.
+        :param pending_kind: kind of the event already pending for the object, or None if there's none
+        :param kind: kind of the newly arrived event
+        :return: the kind of the resulting event
+        """
+        # A change of a newly added object is covered by its addition, since both result in the same fetch, whereas
+        # CHANGE events aren't handled for some facilities at all
+        if pending_kind == lib_pulseaudio.PA_SUBSCRIPTION_EVENT_NEW and \
+                kind == lib_pulseaudio.PA_SUBSCRIPTION_EVENT_CHANGE:
+            return pending_kind
+
+        # The final kind wins otherwise
+        return kind
+
+    def push(self, facility: int, kind: int, index: int):
+        """Register a subscription event. Can be called from any thread.
+        :param facility: event facility, one of the PA_SUBSCRIPTION_EVENT_* facility constants
+        :param kind: event kind, one of PA_SUBSCRIPTION_EVENT_NEW, PA_SUBSCRIPTION_EVENT_CHANGE or
+                     PA_SUBSCRIPTION_EVENT_REMOVE
+        :param index: index of the object the event relates to
+        """
+        with self._lock:
+            self.received += 1
+            key = (facility, index)
+            if self._enqueue(key):
+                self._pending[key] = self.merge_kinds(self._pending.get(key), kind)
+                # The merged event takes the position of the latest one, so that events depending on others (such as a
+                # server change naming a new default sink) are still dispatched after them
+                self._pending.move_to_end(key)
+
+    def clear(self):
+        """Discard all pending events, e.g. because they relate to a context that's no longer valid."""
+        with self._lock:
+            self._pending.clear()
+            self._overflown = False
+            if self._source_id is not None:
+                GLib.source_remove(self._source_id)
+                self._source_id = None
+
+    def _enqueue(self, key) -> bool:
+        """Check whether an event with the given key can be put into the queue and schedule draining it. Must be called
+        with the lock held.
+        :return: whether the event is to be stored
+        """
+        # Everything is going to be refetched anyway after an overflow
+        if self._overflown:
+            return False
+
+        # Check for an overflow (existing events are updated in place and therefore never overflow the queue)
+        if key not in self._pending and len(self._pending) >= self.max_size:
+            self.overflows += 1
+            self._overflown = True
+            self._pending.clear()
+            logging.debug('.events: queue overflown (%d events), falling back to a resync', self.max_size)
+
+        # Schedule draining unless it's already scheduled
+        if self._source_id is None:
+            if self.window_ms > 0:
+                self._source_id = GLib.timeout_add(self.window_ms, self._drain)
+            else:
+                self._source_id = GLib.idle_add(self._drain)
+        return not self._overflown
+
+    def _drain(self) -> bool:
+        """Process a batch of pending events. Always runs on the GUI thread."""
+        # Grab a batch of events, so that new ones can be collected while these are being processed
+        with self._lock:
+            do_resync = self._overflown
+            self._overflown = False
+            batch = [self._pending.popitem(last=False) for _ in range(min(self.batch_size, len(self._pending)))]
+
+        # Run a full resync after an overflow
+        if do_resync:
+            self.resync()
+
+        # Dispatch every coalesced event
+        for (facility, index), kind in batch:
+            self.dispatched += 1
+            self.dispatch(facility, kind, index)
+
+        logging.debug(
+            '.events: dispatched %d event(s); %d received, %d dispatched, %d overflow(s) in total',
+            len(batch), self.received, self.dispatched, self.overflows)
+
+        # Continue with the next batch as soon as possible if there are more events pending
+        with self._lock:
+            if self._pending or self._overflown:
+                self._source_id = GLib.idle_add(self._drain)
+            else:
+                self._source_id = None
+
+        # Prevent this source from being called again
+        return False
+
+
+class ChangeRateLimiter:
+    """Limits the rate at which CHANGE events are processed for every single object (identified by its facility and
+    index). An event arriving too soon after the previous one isn't lost but deferred until the interval has elapsed,
+    so that the final state of the object is always fetched. Must only be used on the GUI thread.
+    """
+
+    def __init__(self, on_deferred: callable, interval_ms: int = CHANGE_INTERVAL_MS):
+        """Constructor.
+        :param on_deferred: callback receiving (facility, index) once a deferred event is due
+        :param interval_ms: min interval (in milliseconds) between two processed events for the same object
+        """
+        self.on_deferred = on_deferred
+        self.interval    = max(interval_ms, 0) / 1000
+        # -- Total number of deferred events
+        self.deferred    = 0
+        self._last_times = {}  # (facility, index) => monotonic time the last event was let through
+        self._source_ids = {}  # (facility, index) => ID of the GLib source of the deferred event
+
+    def allow(self, facility: int, index: int) -> bool:
+        """Check whether a CHANGE event for the given object can be processed right away, otherwise defer it.
+        :param facility: event facility, one of the PA_SUBSCRIPTION_EVENT_* facility constants
+        :param index: index of the object the event relates to
+        :return: True if the event is to be processed now, False if it's been deferred
+        """
+        key = (facility, index)
+
+        # If there's a deferred event already, it will cover this one
+        if key in self._source_ids:
+            return False
+
+        # Let the event through if the interval has elapsed
+        now = time.monotonic()
+        last = self._last_times.get(key)
+        if last is None or now - last >= self.interval:
+            self._last_times[key] = now
+            return True
+
+        # Defer the event otherwise
+        self.deferred += 1
+        self._source_ids[key] = GLib.timeout_add(int((self.interval - (now - last)) * 1000) + 1, self._fire, key)
+        return False
+
+    def forget(self, facility: int, index: int):
+        """Discard any state kept for the given object, e.g. because it's been removed."""
+        key = (facility, index)
+        self._last_times.pop(key, None)
+        source_id = self._source_ids.pop(key, None)
+        if source_id is not None:
+            GLib.source_remove(source_id)
+
+    def clear(self):
+        """Discard any state kept for all objects."""
+        for source_id in self._source_ids.values():
+            GLib.source_remove(source_id)
+        self._source_ids.clear()
+        self._last_times.clear()
+
+    def _fire(self, key: tuple) -> bool:
+        """Pass a deferred event on once it's due."""
+        del self._source_ids[key]
+
+        # Make sure the event passes through
+        del self._last_times[key]
+        self.on_deferred(*key)
+
+        # Prevent this source from being called again
+        return False
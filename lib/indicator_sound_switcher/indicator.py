@@ -1,26 +1,36 @@
 import os.path
 import logging
-import time
-import pkg_resources
+import random
+import sys
 
 import gi
 
-gi.require_version('Gtk', '3.0')
-from gi.repository import GObject, Gtk, GLib
+from .startup import profiler
 
-try:
-    gi.require_version('AyatanaAppIndicator3', '0.1')
-    from gi.repository import AyatanaAppIndicator3 as AppIndicator
-except ValueError:
-    gi.require_version('AppIndicator3', '0.1')
-    from gi.repository import AppIndicator3 as AppIndicator
+with profiler.phase('import Gtk'):
+    gi.require_version('Gtk', '3.0')
+    from gi.repository import GObject, Gtk, GLib
 
-from .lib_pulseaudio import *
+with profiler.phase('import AppIndicator'):
+    try:
+        gi.require_version('AyatanaAppIndicator3', '0.1')
+        from gi.repository import AyatanaAppIndicator3 as AppIndicator
+    except ValueError:
+        gi.require_version('AppIndicator3', '0.1')
+        from gi.repository import AppIndicator3 as AppIndicator
+
+with profiler.phase('import lib_pulseaudio'):
+    from .lib_pulseaudio import *
+from . import pa_info
+from .cache import MenuCache
 from .card import CardProfile, Card
 from .port import Port
-from .stream import Source, Sink
-from .config import Config, KeyboardManager
-from .prefs import PreferencesDialog
+from .stream import Stream, StreamPortIndex, Source, Sink
+from .config import Config, KeyboardManager, ShortcutIndex
+from .events import EventQueue, ChangeRateLimiter
+from .menu import IndicatorMenu, MenuSection
+from .operations import PAOperation, PAOperationManager
+from .switcher import PortSwitch, SwitchCoordinator
 
 # Global definitions
 APP_ID      = 'indicator-sound-switcher'
@@ -37,16 +47,54 @@ PURPOSE. See the GNU General Public License for more details.
 You should have received a copy of the GNU General Public License along
 with this program. If not, see http://www.gnu.org/licenses/"""
 
+
+def get_app_version() -> str:
+    """Determine the version of the installed application package. importlib.metadata only reads the package's own
+    metadata, whereas pkg_resources scans all installed distributions, so the latter is only used on Python < 3.8.
+    """
+    try:
+        from importlib.metadata import version
+    except ImportError:
+        import pkg_resources
+        return pkg_resources.require(APP_ID)[0].version
+    return version(APP_ID)
+
+
 # Determine app version
-APP_VERSION = pkg_resources.require(APP_ID)[0].version
+with profiler.phase('version lookup'):
+    APP_VERSION = get_app_version()
 
 YESNO = {False: 'No', True: 'Yes'}
 
 CARD_NONE_SINK   = -1
 CARD_NONE_SOURCE = -2
 
-# Max number of retries to (re)connect to the PulseAudio daemon before giving up
-PULSEAUDIO_MAX_RETRIES = 100
+# Delay (in milliseconds) before the first retry to (re)connect to the PulseAudio daemon, doubled with every failed
+# attempt up to the max delay
+PULSEAUDIO_RETRY_DELAY_MS     = 500
+PULSEAUDIO_RETRY_MAX_DELAY_MS = 30000
+
+# Max relative deviation of the actual retry delay from the computed one, to spread reconnecting clients apart
+PULSEAUDIO_RETRY_JITTER = 0.2
+
+# Default time (in milliseconds) to wait for the PulseAudio context to get ready before giving up the attempt
+PULSEAUDIO_CONNECT_TIMEOUT_MS = 2000
+
+# Default time window (in milliseconds) to coalesce PulseAudio subscription events in
+EVENT_WINDOW_MS = 50
+
+# Default min interval (in milliseconds) between two processed change events for the same sink or source
+CHANGE_INTERVAL_MS = 200
+
+# Default deadline (in milliseconds) for PulseAudio operations
+PA_OPERATION_TIMEOUT_MS = 5000
+
+# Default time (in milliseconds) to wait for the streams of a card to show up after switching its profile, before
+# falling back to reloading all sinks and sources
+PROFILE_SWITCH_TIMEOUT_MS = 1000
+
+# Delay (in milliseconds) before saving the menu cache after a change, so that a burst of changes results in one write
+MENU_CACHE_SAVE_DELAY_MS = 1000
 
 
 # noinspection PyUnusedLocal
@@ -56,19 +104,21 @@ class SoundSwitcherIndicator(GObject.GObject):
         """Constructor."""
         GObject.GObject.__init__(self)
 
-        # Create the indicator object
-        self.ind = AppIndicator.Indicator.new(
-            APP_ID,
-            'indicator-sound-switcher-symbolic',
-            AppIndicator.IndicatorCategory.HARDWARE)
-        self.ind.set_status(AppIndicator.IndicatorStatus.ACTIVE)
-
         # Initialise PulseAudio object lists and references
         self.cards          = {}
         self.sources        = {}
         self.source_outputs = {}
         self.sinks          = {}
         self.sink_inputs    = {}
+        # -- Cards, sinks and sources by their names
+        self.card_names     = {}
+        self.sink_names     = {}
+        self.source_names   = {}
+        # -- Currently active (default) sink and source, if any
+        self.active_sink    = None
+        self.active_source  = None
+        # -- Sink and source ports by the card ports they correspond to
+        self.stream_ports   = StreamPortIndex()
         self._pacb_card_info          = None
         self._pacb_context_notify     = None
         self._pacb_context_subscribe  = None
@@ -80,27 +130,19 @@ class SoundSwitcherIndicator(GObject.GObject):
         self._pacb_source_output_info = None
         self.pa_context               = None
         self.pa_context_connected     = False
-        self.pa_context_failed        = False
+        self.pa_context_serial        = 0
         self.pa_connecting            = False
-
-        # Initialise menu items
-        self.item_header_inputs     = None
-        self.item_separator_inputs  = None
-        self.item_header_outputs    = None
-        self.item_separator_outputs = None
-
-        # Load configuration, if any
-        self.config_file_name = os.path.join(GLib.get_user_config_dir(), APP_ID + '.json')
-        self.config           = self.config_load()
-        self.config_devices   = self.config['devices']
-
-        # Initialise the keyboard manager
-        self.keyboard_manager = KeyboardManager(self.on_port_keyboard_shortcut)
-        self.keyboard_manager.bind_keys(self.config)
-
-        # Create a menu
-        self.menu = Gtk.Menu()
-        self.ind.set_menu(self.menu)
+        # -- Whether the items have been populated from the current context, so their indexes can be relied upon
+        self.pa_populated             = False
+        self.pa_retry_attempt         = 0
+        self.pa_retry_id              = None
+        self.pa_connect_timeout_id    = None
+        self.pa_ops                   = PAOperationManager()
+        # -- Profile switches awaiting new streams:
+        #    card index => (port, profile name, on_switched, on_abandoned, stale stream, timeout source ID)
+        self.profile_switches         = {}
+        # -- Coordinator of port switches, which lets only the latest one through
+        self.switcher                 = SwitchCoordinator(self.activate_switch)
 
         # Initialise the PulseAudio interface
         self.pa_mainloop = None
@@ -117,74 +159,159 @@ class SoundSwitcherIndicator(GObject.GObject):
         self._pacb_source_info        = pa_source_info_cb_t       (self.pacb_source_info)
         self._pacb_source_output_info = pa_source_output_info_cb_t(self.pacb_source_output_info)
 
-        # Connect to the daemon, this will also refill the menu
-        self.pulseaudio_connect()
+        # Start connecting to the daemon right away, so that the connection is established by the PulseAudio thread
+        # while the UI is being set up
+        profiler.begin('PulseAudio connection')
+        with profiler.phase('PulseAudio context setup'):
+            self.pa_connecting    = True
+            self.pa_retry_attempt = 1
+            pa_started            = self.pulseaudio_initialise()
+
+        # Create the indicator object
+        self.ind = AppIndicator.Indicator.new(
+            APP_ID,
+            'indicator-sound-switcher-symbolic',
+            AppIndicator.IndicatorCategory.HARDWARE)
+        self.ind.set_status(AppIndicator.IndicatorStatus.ACTIVE)
+
+        # Initialise menu items
+        self.item_status        = None
+        self.section_inputs     = None
+        self.section_outputs    = None
+        # -- Status text to display at the top of the menu, if any
+        self.menu_status        = None
+        # -- Items restored from the menu cache, awaiting the live state: (kind, owner, port name) => (section, item)
+        self.pending_items      = {}
+        # -- Cache of the menu's port items, and the ID of the GLib source of the scheduled cache save, if any
+        self.menu_cache         = MenuCache(os.path.join(GLib.get_user_cache_dir(), APP_ID + '.json'))
+        self.menu_cache_save_id = None
+
+        # Load configuration, if any
+        self.config_file_name = os.path.join(GLib.get_user_config_dir(), APP_ID + '.json')
+        with profiler.phase('config load'):
+            self.config       = self.config_load()
+        self.config_devices   = self.config['devices']
+        self.pa_op_timeout    = int(self.config['operation_timeout_ms', PA_OPERATION_TIMEOUT_MS]) or None
+        self.pa_conn_timeout  = int(self.config['connect_timeout_ms', PULSEAUDIO_CONNECT_TIMEOUT_MS]) or None
+        self.profile_timeout  = max(int(self.config['profile_switch_timeout_ms', PROFILE_SWITCH_TIMEOUT_MS]), 0)
+
+        # Initialise the queue passing PulseAudio events on to the GUI thread
+        self.event_queue = EventQueue(
+            self.do_context_subscribe, self.update_pa_items, int(self.config['event_window_ms', EVENT_WINDOW_MS]))
+
+        # Initialise the rate limiter for sink/source change events
+        self.change_limiter = ChangeRateLimiter(
+            self.do_deferred_change, int(self.config['change_interval_ms', CHANGE_INTERVAL_MS]))
+
+        # Initialise the keyboard manager, if there are any shortcuts
+        self.shortcuts        = ShortcutIndex(self.config)
+        self.keyboard_manager = None
+        with profiler.phase('key binding'):
+            self.keyboard_update()
+
+        # Create a menu
+        self.menu = Gtk.Menu()
+        self.menu_model = IndicatorMenu(self.menu)
+        self.ind.set_menu(self.menu)
+
+        # Connect to the daemon once the first attempt is known to be underway, this will also refill the menu. This is
+        # the join point of the startup: the menu is populated once both the UI and the connection are ready
+        profiler.mark('UI ready')
+        self.pulseaudio_connect(pa_started)
 
     # ------------------------------------------------------------------------------------------------------------------
     # Signal handlers
     # ------------------------------------------------------------------------------------------------------------------
 
-    def do_context_subscribe(self, facility: int, kind: int, index: int) -> bool:
-        """Context status change handler. Always runs on the GUI thread."""
+    def do_context_subscribe(self, facility: int, kind: int, index: int):
+        """Context status change handler, receives events coalesced by the event queue. Always runs on the GUI
+        thread."""
         logging.debug('.do_context_subscribe(facility: %d, kind: %d, index: %d)', facility, kind, index)
 
         # Dispatch the callback
         # -- Source
         if facility == PA_SUBSCRIPTION_EVENT_SOURCE:
-            # Active port change events are fired as PA_SUBSCRIPTION_EVENT_CHANGE
-            if kind == PA_SUBSCRIPTION_EVENT_NEW or kind == PA_SUBSCRIPTION_EVENT_CHANGE:
-                self.synchronise_op(
+            # Active port change events are fired as PA_SUBSCRIPTION_EVENT_CHANGE. These are also fired on every volume
+            # change, so limit their rate
+            if kind == PA_SUBSCRIPTION_EVENT_NEW or \
+                    (kind == PA_SUBSCRIPTION_EVENT_CHANGE and self.change_limiter.allow(facility, index)):
+                self.pa_ops.submit(
                     'pa_context_get_source_info_by_index()',
-                    pa_context_get_source_info_by_index(self.pa_context, index, self._pacb_source_info, None))
+                    lambda ctx, ud: pa_context_get_source_info_by_index(ctx, index, self._pacb_source_info, ud),
+                    self.pa_results_handler(self.source_info),
+                    self.pa_op_timeout)
             elif kind == PA_SUBSCRIPTION_EVENT_REMOVE:
+                self.change_limiter.forget(facility, index)
                 self.source_remove(index)
 
         # -- Source output
         elif facility == PA_SUBSCRIPTION_EVENT_SOURCE_OUTPUT:
-            if kind == PA_SUBSCRIPTION_EVENT_NEW:
-                self.synchronise_op(
+            # Moves to another source are fired as PA_SUBSCRIPTION_EVENT_CHANGE. These are also fired on every volume
+            # change, so limit their rate
+            if kind == PA_SUBSCRIPTION_EVENT_NEW or \
+                    (kind == PA_SUBSCRIPTION_EVENT_CHANGE and self.change_limiter.allow(facility, index)):
+                self.pa_ops.submit(
                     'pa_context_get_source_output_info()',
-                    pa_context_get_source_output_info(self.pa_context, index, self._pacb_source_output_info, None))
+                    lambda ctx, ud: pa_context_get_source_output_info(ctx, index, self._pacb_source_output_info, ud),
+                    self.pa_results_handler(self.source_output_add),
+                    self.pa_op_timeout)
             elif kind == PA_SUBSCRIPTION_EVENT_REMOVE:
+                self.change_limiter.forget(facility, index)
                 self.source_output_remove(index)
 
         # -- Sink
         elif facility == PA_SUBSCRIPTION_EVENT_SINK:
-            # Active port change events are fired as PA_SUBSCRIPTION_EVENT_CHANGE
-            if kind == PA_SUBSCRIPTION_EVENT_NEW or kind == PA_SUBSCRIPTION_EVENT_CHANGE:
-                self.synchronise_op(
+            # Active port change events are fired as PA_SUBSCRIPTION_EVENT_CHANGE. These are also fired on every volume
+            # change, so limit their rate
+            if kind == PA_SUBSCRIPTION_EVENT_NEW or \
+                    (kind == PA_SUBSCRIPTION_EVENT_CHANGE and self.change_limiter.allow(facility, index)):
+                self.pa_ops.submit(
                     'pa_context_get_sink_info_by_index()',
-                    pa_context_get_sink_info_by_index(self.pa_context, index, self._pacb_sink_info, None))
+                    lambda ctx, ud: pa_context_get_sink_info_by_index(ctx, index, self._pacb_sink_info, ud),
+                    self.pa_results_handler(self.sink_info),
+                    self.pa_op_timeout)
             elif kind == PA_SUBSCRIPTION_EVENT_REMOVE:
+                self.change_limiter.forget(facility, index)
                 self.sink_remove(index)
 
         # -- Sink input
         elif facility == PA_SUBSCRIPTION_EVENT_SINK_INPUT:
-            if kind == PA_SUBSCRIPTION_EVENT_NEW:
-                self.synchronise_op(
+            # Moves to another sink are fired as PA_SUBSCRIPTION_EVENT_CHANGE. These are also fired on every volume
+            # change, so limit their rate
+            if kind == PA_SUBSCRIPTION_EVENT_NEW or \
+                    (kind == PA_SUBSCRIPTION_EVENT_CHANGE and self.change_limiter.allow(facility, index)):
+                self.pa_ops.submit(
                     'pa_context_get_sink_input_info()',
-                    pa_context_get_sink_input_info(self.pa_context, index, self._pacb_sink_input_info, None))
+                    lambda ctx, ud: pa_context_get_sink_input_info(ctx, index, self._pacb_sink_input_info, ud),
+                    self.pa_results_handler(self.sink_input_add),
+                    self.pa_op_timeout)
             elif kind == PA_SUBSCRIPTION_EVENT_REMOVE:
+                self.change_limiter.forget(facility, index)
                 self.sink_input_remove(index)
 
         # -- Card
         elif facility == PA_SUBSCRIPTION_EVENT_CARD:
             if kind == PA_SUBSCRIPTION_EVENT_NEW or kind == PA_SUBSCRIPTION_EVENT_CHANGE:
-                self.synchronise_op(
+                self.pa_ops.submit(
                     'pa_context_get_card_info_by_index()',
-                    pa_context_get_card_info_by_index(self.pa_context, index, self._pacb_card_info, None))
+                    lambda ctx, ud: pa_context_get_card_info_by_index(ctx, index, self._pacb_card_info, ud),
+                    self.pa_results_handler(self.card_info),
+                    self.pa_op_timeout)
             elif kind == PA_SUBSCRIPTION_EVENT_REMOVE:
                 self.card_remove(index)
 
         # -- Server
         elif facility == PA_SUBSCRIPTION_EVENT_SERVER:
             if kind == PA_SUBSCRIPTION_EVENT_CHANGE:
-                self.synchronise_op(
+                self.pa_ops.submit(
                     'pa_context_get_server_info()',
-                    pa_context_get_server_info(self.pa_context, self._pacb_server_info, None))
+                    lambda ctx, ud: pa_context_get_server_info(ctx, self._pacb_server_info, ud),
+                    self.pa_results_handler(self.server_info),
+                    self.pa_op_timeout)
 
-        # Prevent this method from being called again
-        return False
+    def do_deferred_change(self, facility: int, index: int):
+        """Deferred change event handler, invoked by the change rate limiter. Always runs on the GUI thread."""
+        self.do_context_subscribe(facility, PA_SUBSCRIPTION_EVENT_CHANGE, index)
 
     @staticmethod
     def on_about(*args):
@@ -204,6 +331,9 @@ class SoundSwitcherIndicator(GObject.GObject):
     def on_preferences(self, *args):
         """Signal handler: Preferences item clicked."""
         logging.debug('.on_preferences()')
+
+        # The Preferences dialog is seldom used, so only load it on demand
+        from .prefs import PreferencesDialog
         PreferencesDialog.show(self)
 
     def on_quit(self, *args):
@@ -214,9 +344,14 @@ class SoundSwitcherIndicator(GObject.GObject):
     def on_refresh(self, *args):
         """Signal handler: Refresh item clicked."""
         logging.debug('.on_refresh()')
-        self.keyboard_manager.bind_keys(self.config)
-        self.menu_setup()
-        self.update_pa_items()
+        self.keyboard_update()
+
+        # Rebuild the menu from scratch only if its sections have changed, otherwise reconcile the existing items
+        with self.menu_model.transaction('refresh'):
+            if self.menu_sections_changed():
+                self.pa_items_remove_all()
+                self.menu_setup()
+            self.update_pa_items()
 
     def on_select_port(self, widget, data):
         """Signal handler: port selection item clicked."""
@@ -260,10 +395,11 @@ class SoundSwitcherIndicator(GObject.GObject):
         """Card info callback."""
         if struct:
             # New card info arrived
-            self.card_info(struct.contents)
+            self.pa_ops.add_result(user_data, pa_info.card_info_from_struct(struct.contents))
 
-        # Wake up PA's thread
-        pa_threaded_mainloop_signal(self.pa_mainloop, 0)
+        # Signal the end of the list
+        if eol:
+            self.pa_ops.complete(user_data, eol > 0)
 
     def pacb_context_notify(self, context, user_data):
         """Connection status callback."""
@@ -276,135 +412,114 @@ class SoundSwitcherIndicator(GObject.GObject):
 
         # Context connection failed
         elif ctxstate == PA_CONTEXT_FAILED:
-            self.pa_context_failed = True
-            self.pa_context = None
+            self.pa_context_connected = False
             logging.warning('Context failed')
 
-            # If we're not connecting, try to reconnect
-            if not self.pa_connecting:
-                logging.info('Reconnecting to PulseAudio')
-                GObject.idle_add(self.pulseaudio_connect)
-
         # Context connection ended - end the mainloop
         elif ctxstate == PA_CONTEXT_TERMINATED:
             logging.info('Context terminated')
 
+        # Act on the state change on the GUI thread right away
+        if ctxstate in (PA_CONTEXT_READY, PA_CONTEXT_FAILED):
+            GLib.idle_add(self.pulseaudio_context_changed, self.pa_context_serial, ctxstate)
+
     def pacb_context_subscribe(self, context, event_type, index, user_data):
         """Context subscription callback."""
         facility = event_type & PA_SUBSCRIPTION_EVENT_FACILITY_MASK
         kind     = event_type & PA_SUBSCRIPTION_EVENT_TYPE_MASK
 
-        # Pass the event on to the main GUI thread
-        GObject.idle_add(self.do_context_subscribe, facility, kind, index)
-
-        # Wake up PA's thread
-        pa_threaded_mainloop_signal(self.pa_mainloop, 0)
+        # Pass the event on to the main GUI thread via the event queue
+        self.event_queue.push(facility, kind, index)
 
-    def pacb_context_success(self, context, c_int, user_data):
+    def pacb_context_success(self, context, success, user_data):
         """Context success callback."""
-        # Wake up PA's thread
-        pa_threaded_mainloop_signal(self.pa_mainloop, 0)
+        self.pa_ops.complete(user_data, bool(success))
 
     def pacb_server_info(self, context, struct, user_data):
         """Server info callback."""
         if struct:
-            self.activate_sink  (struct.contents.default_sink_name.decode())
-            self.activate_source(struct.contents.default_source_name.decode())
+            self.pa_ops.add_result(user_data, pa_info.server_info_from_struct(struct.contents))
+        self.pa_ops.complete(user_data, bool(struct))
 
-        # Schedule a port status update on the main GUI thread
-        GObject.idle_add(self.card_update_all_ports_activity)
-
-        # Wake up PA's thread
-        pa_threaded_mainloop_signal(self.pa_mainloop, 0)
-
-    def pacb_sink_info(self, context, struct, index, user_data):
+    def pacb_sink_info(self, context, struct, eol, user_data):
         """Sink info callback."""
         if struct:
-            self.sink_info(struct.contents)
+            self.pa_ops.add_result(user_data, pa_info.sink_info_from_struct(struct.contents))
 
-        # Wake up PA's thread
-        pa_threaded_mainloop_signal(self.pa_mainloop, 0)
+        # Signal the end of the list
+        if eol:
+            self.pa_ops.complete(user_data, eol > 0)
 
     def pacb_sink_input_info(self, context, struct, eol, user_data):
         """Sink input info callback."""
         if struct:
             # New sink input info arrived
-            self.sink_input_add(struct.contents.index, struct.contents.name.decode(), struct.contents.sink)
+            self.pa_ops.add_result(user_data, pa_info.sink_input_info_from_struct(struct.contents))
 
-        # Wake up PA's thread
-        pa_threaded_mainloop_signal(self.pa_mainloop, 0)
+        # Signal the end of the list
+        if eol:
+            self.pa_ops.complete(user_data, eol > 0)
 
-    def pacb_source_info(self, context, struct, index, user_data):
+    def pacb_source_info(self, context, struct, eol, user_data):
         """Source info callback."""
         # Skip "sink monitor" sources
         if struct and (struct.contents.monitor_of_sink == PA_INVALID_INDEX):
-            self.source_info(struct.contents)
+            self.pa_ops.add_result(user_data, pa_info.source_info_from_struct(struct.contents))
 
-        # Wake up PA's thread
-        pa_threaded_mainloop_signal(self.pa_mainloop, 0)
+        # Signal the end of the list
+        if eol:
+            self.pa_ops.complete(user_data, eol > 0)
 
     def pacb_source_output_info(self, context, struct, eol, user_data):
         """Source output info callback."""
         if struct:
             # New source output info arrived
-            self.source_output_add(struct.contents.index, struct.contents.name.decode())
+            self.pa_ops.add_result(user_data, pa_info.source_output_info_from_struct(struct.contents))
 
-        # Wake up PA's thread
-        pa_threaded_mainloop_signal(self.pa_mainloop, 0)
+        # Signal the end of the list
+        if eol:
+            self.pa_ops.complete(user_data, eol > 0)
 
     # ------------------------------------------------------------------------------------------------------------------
     # Card list related procs
     # ------------------------------------------------------------------------------------------------------------------
 
     @staticmethod
-    def card_fetch_profiles(num_profiles: int, pa_profiles: list, active_profile_name: str) -> dict:
-        """Extract card profiles from a PA data structure.
+    def card_fetch_profiles(pa_profiles: tuple, active_profile_name: str) -> dict:
+        """Make card profiles from PA profile info.
         :return: profiles as a dictionary {name: CardProfile}
         """
-        profiles = {}
-        idx = 0
-        while idx < num_profiles:
-            pa_profile = pa_profiles[idx]
-            profile_name = pa_profile.name.decode()
-            profiles[profile_name] = CardProfile(
-                profile_name,
-                pa_profile.description.decode(),
-                pa_profile.n_sinks,
-                pa_profile.n_sources,
+        return {
+            pa_profile.name: CardProfile(
+                pa_profile.name,
+                pa_profile.description,
+                pa_profile.num_sinks,
+                pa_profile.num_sources,
                 pa_profile.priority,
-                profile_name == active_profile_name)
-            idx += 1
-        return profiles
+                pa_profile.name == active_profile_name)
+            for pa_profile in pa_profiles
+        }
 
     @staticmethod
-    def card_fetch_ports(pa_ports: list, ports_cfg: Config) -> dict:
-        """Extract card ports from a PA data structure.
+    def card_fetch_ports(pa_ports: tuple, ports_cfg: Config) -> dict:
+        """Make card ports from PA port info.
         :return: ports as a dictionary {name: Port}
         """
         ports = {}
-        if pa_ports:
-            idx = 0
-            while True:
-                port_ptr = pa_ports[idx]
-                # NULL pointer terminates the array
-                if not port_ptr:
-                    break
-                pa_port = port_ptr.contents
-                port_name = pa_port.name.decode()
-                port_cfg = ports_cfg[port_name]
-                # Add a port object
-                ports[port_name] = Port(
-                    port_name,
-                    pa_port.description.decode(),
-                    port_cfg['name', ''],
-                    pa_port.priority,
-                    pa_port.available != PA_PORT_AVAILABLE_NO,
-                    bool(port_cfg['visible', True]),
-                    pa_port.direction,
-                    [pa_port.profiles[i].contents.name.decode() for i in range(0, pa_port.n_profiles)],
-                    port_cfg['preferred_profile', None],
-                    port_cfg['always_available', False])
-                idx += 1
+        for pa_port in pa_ports:
+            port_cfg = ports_cfg[pa_port.name]
+            # Add a port object
+            ports[pa_port.name] = Port(
+                pa_port.name,
+                pa_port.description,
+                port_cfg['name', ''],
+                pa_port.priority,
+                pa_port.is_available,
+                bool(port_cfg['visible', True]),
+                pa_port.direction,
+                list(pa_port.profiles),
+                port_cfg['preferred_profile', None],
+                port_cfg['always_available', False])
         return ports
 
     def card_create_menu_items(self, card):
@@ -412,33 +527,55 @@ class SoundSwitcherIndicator(GObject.GObject):
         for port in card.ports.values():
             # If the port and its section are to be displayed in the menu
             if port.is_visible:
-                hdr_item = self.item_header_outputs    if port.is_output else self.item_header_inputs
-                sep_item = self.item_separator_outputs if port.is_output else self.item_separator_inputs
-                if hdr_item is not None and sep_item is not None:
+                section = self.section_outputs if port.is_output else self.section_inputs
+                if section is not None:
                     # Create a menu item and save it in the port object
-                    port.menu_item = self.menu_insert_ordered_item(
-                        hdr_item, sep_item, port.get_menu_item_title(), port.is_available or port.always_avail)
+                    port.menu_item = self.menu_insert_port_item(
+                        section, ('card', card.name, port.name), port.get_menu_item_title(),
+                        port.is_available or port.always_avail)
                     # Bind a click handler
                     port.handler_id = port.menu_item.connect('activate', self.on_select_port, (card.index, port.name))
 
-    def card_info(self, data):
+    def card_info(self, info: pa_info.CardInfo):
         """Register a new Card instance or updates an existing one."""
-        # Fetch properties from the data struct
-        index         = data.index
-        name          = data.name.decode()
-        act_prof_name = data.active_profile.contents.name.decode()
+        # Fetch properties from the info
+        index         = info.index
+        name          = info.name
+        act_prof_name = info.active_profile
 
         # Try to fetch the card's configuration
         card_cfg = self.config_devices[name]
-
-        # Prepare ports array
-        card_ports = self.card_fetch_ports(data.ports, card_cfg['ports'])
+        display_name = card_cfg['name', '']
+
+        # Prepare ports and profiles dicts
+        card_ports    = self.card_fetch_ports(info.ports, card_cfg['ports'])
+        card_profiles = self.card_fetch_profiles(info.profiles, act_prof_name)
+
+        # If there's no port on this card (most likely Bluetooth), create a couple of dummy ones
+        if not card_ports:
+            card_ports['#dummy_out'] = Port(
+                '#dummy_out', None, '', -1, True, True, PA_DIRECTION_OUTPUT, None, None, False)
+            card_ports['#dummy_in']  = Port(
+                '#dummy_in',  None, '', -1, True, True, PA_DIRECTION_INPUT,  None, None, False)
+
+        # If the card exists, but its menu items cannot be retained, drop it to recreate it from scratch
+        if index in self.cards and self.card_needs_rebuild(self.cards[index], name, display_name, card_ports):
+            logging.debug('  * Card[%d] `%s` changed, rebuilding', index, name)
+            self.card_remove(index)
 
         # If card already exists, fetch it
         if index in self.cards:
             card = self.cards[index]
             logging.debug('  * Card[%d] `%s` updated', index, card.name)
 
+            # Replace profiles if their set has changed
+            profiles_changed = False
+            if {n: p.priority for n, p in card.profiles.items()} != \
+                    {n: p.priority for n, p in card_profiles.items()}:
+                logging.debug('    * Profiles changed')
+                card.profiles = card_profiles
+                profiles_changed = True
+
             # Update active profile
             cur_profile = card.get_active_profile()
             for profile in card.profiles.values():
@@ -449,22 +586,33 @@ class SoundSwitcherIndicator(GObject.GObject):
                         cur_profile.get_id_text() if cur_profile else 'None',
                         profile.get_id_text())
 
-            # Update port availability
+            # Update port properties and availability
             for new_port in card_ports.values():
-                if new_port.name in card.ports:
-                    port = card.ports[new_port.name]
-                    if port.is_available != new_port.is_available:
-                        port.is_available = new_port.is_available
-                        logging.debug(
-                            '    * Port is made %savailable: %s',
-                            '' if port.is_available else 'un', port.get_id_text())
+                port = card.ports[new_port.name]
+                if port.profiles != new_port.profiles or port.pref_profile != new_port.pref_profile:
+                    port.profiles     = new_port.profiles
+                    port.pref_profile = new_port.pref_profile
+                    profiles_changed  = True
+                if port.is_available != new_port.is_available or port.always_avail != new_port.always_avail:
+                    port.always_avail = new_port.always_avail
+                    port.is_available = new_port.is_available
+                    logging.debug(
+                        '    * Port is made %savailable: %s',
+                        '' if port.is_available else 'un', port.get_id_text())
+                    self.menu_cache_schedule_save()
+
+            # Rebuild the table of profiles supporting each port, if it's outdated
+            if profiles_changed:
+                card.update_port_profiles()
+
+            # Proceed with the pending profile switch, if the card's streams have been retained
+            if index in self.profile_switches:
+                self.card_profile_switch_check(index)
 
         # Otherwise, register a new card object
         else:
-            logging.debug('  + Card[%d] added: `%s`, driver: `%s`', index, name, data.driver.decode())
+            logging.debug('  + Card[%d] added: `%s`, driver: `%s`', index, name, info.driver)
 
-            # Prepare profiles dict
-            card_profiles = self.card_fetch_profiles(data.n_profiles, data.profiles, act_prof_name)
             # Log profiles
             for profile in card_profiles.values():
                 logging.debug(
@@ -480,20 +628,33 @@ class SoundSwitcherIndicator(GObject.GObject):
                     for port_profile_name in port.profiles:
                         logging.debug('      . Supported profile: `%s`', port_profile_name)
 
-            # If there's no port on this card (most likely Bluetooth), create a couple of dummy ones
-            if not card_ports:
-                card_ports['#dummy_out'] = Port(
-                    '#dummy_out', None, '', -1, True, True, PA_DIRECTION_OUTPUT, None, None, False)
-                card_ports['#dummy_in']  = Port(
-                    '#dummy_in',  None, '', -1, True, True, PA_DIRECTION_INPUT,  None, None, False)
-
             # Create and register a new card object
             self.cards[index] = card = Card(
-                index, name, card_cfg['name', ''], data.driver.decode(), card_profiles, card_ports,
-                data.proplist.contents)
+                index, name, display_name, info.driver, card_profiles, card_ports, info.properties)
+            self.card_names[name] = card
 
-            # Add a menu item for each card port
+            # Add a menu item for each card port and update their state in case the card's streams already exist
             self.card_create_menu_items(card)
+            self.card_update_ports_activity(index)
+
+    @staticmethod
+    def card_needs_rebuild(card, name: str, display_name: str, card_ports: dict) -> bool:
+        """Check whether an existing card needs to be recreated in order to reflect its updated configuration or ports,
+        because its menu items have to be set up differently, or because its index now refers to a different card.
+        :param card: existing card
+        :param name: card name from the fresh card info
+        :param display_name: card display name from the configuration
+        :param card_ports: freshly fetched card ports
+        :return: True if the card has to be recreated
+        """
+        return \
+            card.name != name or \
+            card.display_name != display_name or \
+            card.ports.keys() != card_ports.keys() or \
+            any(
+                port.display_name != card.ports[port.name].display_name or
+                port.is_visible != card.ports[port.name].is_visible
+                for port in card_ports.values())
 
     def card_remove(self, index: int):
         """Remove a Card instance by its index (PulseAudio's card index)."""
@@ -504,47 +665,74 @@ class SoundSwitcherIndicator(GObject.GObject):
             # Remove all card ports' menu items
             for port in card.ports.values():
                 if port.menu_item:
-                    self.menu.remove(port.menu_item)
+                    self.menu_remove_item(port.menu_item)
 
             # Remove the card object
             del self.cards[index]
+            if self.card_names.get(card.name) is card:
+                del self.card_names[card.name]
+
+            # Nothing is going to show up for the card anymore
+            self.card_profile_switch_cancel(index)
+
+    def card_rekey(self, card, info: pa_info.CardInfo):
+        """Re-register a Card instance under a new index, see pa_reconcile_handler()."""
+        logging.debug('  * Card[%d] `%s` is now card[%d]', card.index, card.name, info.index)
+        card.index = info.index
+        self.cards[card.index] = card
+
+        # Rebind the menu items' click handlers
+        for port in card.ports.values():
+            if port.menu_item:
+                self.menu_item_rebind(port, (card.index, port.name))
 
     def card_remove_all(self):
         """Remove all Card instances."""
         for index in list(self.cards.keys()):
             self.card_remove(index)
 
-    def card_update_all_ports_activity(self):
-        """Update the is_active state for ports on all cards."""
-        for card in self.cards.values():
-            card.update_port_activity(self.sources, self.sinks)
-
-    def card_switch_profile(self, port, can_keep_current: bool) -> bool:
-        """Find the most appropriate profile for the given card port and activate it on its card.
+    def card_update_ports_activity(self, *card_indexes: int):
+        """Update the is_active state for ports on the given cards.
+        :param card_indexes: indexes of the cards to update; unknown ones are ignored
+        """
+        touched = 0
+        for index in set(card_indexes):
+            card = self.cards.get(index)
+            if card is not None:
+                touched += card.update_port_activity(self.stream_ports)
+        if touched:
+            self.menu_cache_schedule_save()
+        logging.debug('.card_update_ports_activity(%s): %d port(s) touched', sorted(set(card_indexes)), touched)
+
+    def card_switch_profile(
+            self, port, can_keep_current: bool, on_switched: callable, on_abandoned: callable) -> bool:
+        """Find the most appropriate profile for the given card port and asynchronously activate it on its card.
         :param port: Port that we need the best profile for
         :param can_keep_current: whether the currently active profile is compatible with this port, so we can keep it
-        :return whether profile has been switched
+        :param on_switched: callback invoked without arguments once the profile has been switched and the port's new
+                            sink/source has shown up. Not invoked if the profile isn't to be switched
+        :param on_abandoned: callback invoked without arguments if the switch fails or is abandoned before the new
+                             sink/source shows up
+        :return whether profile is being switched
         """
         card = port.owner_card
 
-        # Compile a list of profiles supporting the port
-        profiles = {pname: card.profiles[pname] for pname in port.profiles if pname in card.profiles}
-        if not profiles:
+        # Look up the profiles supporting the port
+        port_profiles = card.port_profiles[port.name]
+        if port_profiles.best is None:
             logging.warning(
                 '! Card[%d] has no supported profiles for port `%s`, supposedly device misconfiguration',
                 card.index, port.name)
             return False
 
         # If the port is given a preferred profile, verify it's valid for this port
-        selected_profile = None
-        if port.pref_profile:
-            if port.pref_profile in profiles:
-                selected_profile = profiles[port.pref_profile]
-                logging.debug('* Preferred profile `%s` is specified for port %s', port.pref_profile, port.get_id_text())
-            else:
-                logging.warning(
-                    '! Cannot activate preferred profile `%s` for port %s as this port doesn\'t support it',
-                    port.pref_profile, port.get_id_text())
+        selected_profile = port_profiles.preferred
+        if selected_profile:
+            logging.debug('* Preferred profile `%s` is specified for port %s', port.pref_profile, port.get_id_text())
+        elif port.pref_profile:
+            logging.warning(
+                '! Cannot activate preferred profile `%s` for port %s as this port doesn\'t support it',
+                port.pref_profile, port.get_id_text())
 
         # If no preferred profile given and the current one is fine, do nothing
         if not selected_profile and can_keep_current:
@@ -552,7 +740,7 @@ class SoundSwitcherIndicator(GObject.GObject):
 
         # Otherwise, pick the one with max priority
         if not selected_profile:
-            selected_profile = max(profiles.values(), key=lambda k: k.priority)
+            selected_profile = port_profiles.best
 
         # Don't bother if the profile is already active (it won't help anyway)
         if selected_profile.is_active:
@@ -563,39 +751,130 @@ class SoundSwitcherIndicator(GObject.GObject):
         logging.debug(
             '* Switching card[%d] to profile %s with priority %d',
             card.index, selected_profile.get_id_text(), selected_profile.priority)
-        self.synchronise_op(
+        # Switching a profile replaces the card's sinks and/or sources. Wait for the events announcing the new ones
+        # before proceeding, rather than reloading all PA objects
+        self.card_profile_switch_start(card, port, selected_profile.name, on_switched, on_abandoned)
+        self.pa_ops.submit(
             'pa_context_set_card_profile_by_index()',
-            pa_context_set_card_profile_by_index(
-                self.pa_context,
-                card.index,
-                selected_profile.name.encode(),
-                self._pacb_context_success,
-                None))
-
-        # Reload all PA objects, except cards, because switching a profile may result in a change in the list of
-        # available sources and/or sinks for that card
-        self.update_pa_items(update_cards=False)
+            lambda ctx, ud: pa_context_set_card_profile_by_index(
+                ctx, card.index, selected_profile.name.encode(), self._pacb_context_success, ud),
+            lambda op: self.card_profile_switch_requested(op, card.index),
+            self.pa_op_timeout)
         return True
 
+    def card_profile_switch_start(
+            self, card, port, profile_name: str, on_switched: callable, on_abandoned: callable):
+        """Start waiting for the stream the given card port maps to to show up after a profile switch. Any switch still
+        pending for the same card is superseded.
+        :param card:         card whose profile is being switched
+        :param port:         card port to wait for the stream of
+        :param profile_name: name of the profile being activated
+        :param on_switched:  callback invoked without arguments once the stream has shown up
+        :param on_abandoned: callback invoked without arguments if the wait is cancelled
+        """
+        self.card_profile_switch_cancel(card.index)
+
+        # The stream the port maps to now, if any, is usually going to be replaced
+        stale = card.find_stream_port(port, self.stream_ports)[0]
+        timeout_id = GLib.timeout_add(self.profile_timeout, self.card_profile_switch_timed_out, card.index)
+        self.profile_switches[card.index] = (port, profile_name, on_switched, on_abandoned, stale, timeout_id)
+
+    def card_profile_switch_requested(self, op: PAOperation, card_index: int):
+        """Completion callback of the profile switch request: stop waiting if the switch didn't succeed."""
+        if not op.succeeded:
+            logging.warning('Failed to switch the profile of card[%d]', card_index)
+            self.card_profile_switch_cancel(card_index)
+
+    def card_profile_switch_check(self, card_index: int):
+        """Complete the profile switch pending for the given card, if any, once its port maps to a new stream, or to
+        any stream once the card reports the new profile as active: a sink or source shared by the old and the new
+        profile is retained by PulseAudio. Called whenever the card or a sink or source of it has been updated.
+        :param card_index: index of the card
+        """
+        switch = self.profile_switches.get(card_index)
+        card   = self.cards.get(card_index)
+        if switch is None or card is None:
+            return
+        port, profile_name, on_switched, on_abandoned, stale, timeout_id = switch
+        stream = card.find_stream_port(port, self.stream_ports)[0]
+        if stream is None:
+            return
+        if stream is stale:
+            profile = card.profiles.get(profile_name)
+            if profile is None or not profile.is_active:
+                return
+
+        # The stream is there: stop waiting and proceed
+        logging.debug('* Card[%d] profile switched, port %s maps to `%s`', card_index, port.get_id_text(), stream.name)
+        GLib.source_remove(timeout_id)
+        del self.profile_switches[card_index]
+        on_switched()
+
+    def card_profile_switch_timed_out(self, card_index: int) -> bool:
+        """Stop waiting for the card's new stream to show up, and reload all sinks and sources instead."""
+        on_switched = self.profile_switches.pop(card_index)[2]
+        logging.info(
+            'No new stream showed up for card[%d] in %d ms after switching its profile, reloading all streams',
+            card_index, self.profile_timeout)
+        self.update_pa_items(update_cards=False, on_done=lambda group: on_switched())
+
+        # Prevent this source from being called again
+        return False
+
+    def card_profile_switch_cancel(self, card_index: int):
+        """Stop waiting for the profile switch pending for the given card, if any, without completing it."""
+        switch = self.profile_switches.pop(card_index, None)
+        if switch is not None:
+            logging.debug('* Card[%d] profile switch to port `%s` abandoned', card_index, switch[0].name)
+            GLib.source_remove(switch[5])
+            switch[3]()
+
     # ------------------------------------------------------------------------------------------------------------------
     # Sink list related procs
     # ------------------------------------------------------------------------------------------------------------------
 
-    def sink_info(self, data):
+    def sink_info(self, info: pa_info.StreamInfo):
         """Register a new Sink instance or update an existing one."""
-        # Fetch properties from the data struct
-        index       = data.index
-        name        = data.name.decode()
-        description = data.description.decode()
+        # Fetch properties from the info
+        index       = info.index
+        name        = info.name
+        description = info.description
+
+        fingerprint = Stream.get_fingerprint(info)
+
+        # Remember the default sink, as rebuilding it below resets it, and no server info update is to follow
+        active_name = self.active_sink.name if self.active_sink is not None else None
+
+        # If it's a virtual sink whose configuration has changed, drop it to recreate it from scratch
+        if index in self.sinks and self.virtual_stream_changed(self.sinks[index], 'sinks', self.section_outputs):
+            logging.debug('  * Sink[%d] configuration changed, rebuilding', index)
+            self.sink_remove(index)
+
+        # Same if the index now refers to a different sink, or its card or ports have changed
+        if index in self.sinks and self.stream_needs_rebuild(self.sinks[index], info):
+            logging.debug('  * Sink[%d] `%s` changed, rebuilding', index, name)
+            self.sink_remove(index)
 
         # If sink already exists, fetch it
         if index in self.sinks:
-            logging.debug('  * Sink[%d] updated: `%s`, card %d', index, name, data.card)
             sink = self.sinks[index]
 
+            # Skip the update if nothing relevant has changed
+            if sink.fingerprint == fingerprint:
+                logging.debug('  * Sink[%d] unchanged: `%s`', index, name)
+                return
+            logging.debug('  * Sink[%d] updated: `%s`, card %d', index, name, info.card)
+
+            # Update port availability (the set of ports is the same, see stream_needs_rebuild(); virtual ones only
+            # have a dummy port)
+            for port_info in info.ports:
+                port = sink.ports.get(port_info.name)
+                if port is not None:
+                    port.is_available = port_info.is_available
+
         # Otherwise register a new sink object
         else:
-            logging.debug('  + Sink[%d] added: `%s`, card %d', index, name, data.card)
+            logging.debug('  + Sink[%d] added: `%s`, card %d', index, name, info.card)
 
             # Prepare ports array
             sink_ports = {}
@@ -603,7 +882,7 @@ class SoundSwitcherIndicator(GObject.GObject):
             sink_visible = False
 
             # If it's a virtual sink, add a dummy port
-            virtual_card = self.is_virtual_card(data.card)
+            virtual_card = self.is_virtual_card(info.card)
             if virtual_card:
                 port = Port('#dummy_out', None, '', -1, True, True, PA_DIRECTION_OUTPUT, None, None, False)
                 sink_ports[port.name] = port
@@ -611,22 +890,15 @@ class SoundSwitcherIndicator(GObject.GObject):
                 sink_name    = sink_cfg['name', '']
                 sink_visible = bool(sink_cfg['visible', True])
 
-            # Else iterate through ports[] (array of pointers to structs)
-            elif data.ports:
-                idx_port = 0
-                while True:
-                    port_ptr = data.ports[idx_port]
-                    # NULL pointer terminates the array
-                    if not port_ptr:
-                        break
-
-                    port_struct = port_ptr.contents
+            # Else iterate through its ports
+            else:
+                for port_info in info.ports:
                     port = Port(
-                        port_struct.name.decode(),
-                        port_struct.description.decode(),
+                        port_info.name,
+                        port_info.description,
                         '',
-                        port_struct.priority,
-                        port_struct.available != PA_PORT_AVAILABLE_NO,
+                        port_info.priority,
+                        port_info.is_available,
                         False,
                         PA_DIRECTION_OUTPUT,
                         None,
@@ -636,33 +908,43 @@ class SoundSwitcherIndicator(GObject.GObject):
                     logging.debug(
                         '    + Sink port added: %s; priority: %d; available: %s',
                         port.get_id_text(), port.priority, YESNO[port.is_available])
-                    idx_port += 1
 
             # Create and register a new instance of Sink object (this will also set owner_stream in each port)
-            sink = Sink(index, name, sink_name, description, sink_ports, data.card)
+            sink = Sink(index, name, sink_name, description, sink_ports, info.card)
             self.sinks[index] = sink
+            self.sink_names[name] = sink
+            self.stream_ports.add_stream(sink)
 
             # If it's a virtual sink, and it's visible, create its menu item
-            if virtual_card and sink_visible and self.item_header_outputs is not None and \
-                    self.item_separator_outputs is not None:
+            if virtual_card and sink_visible and self.section_outputs is not None:
                 for port in sink_ports.values():
-                    port.menu_item = self.menu_insert_ordered_item(
-                        self.item_header_outputs,
-                        self.item_separator_outputs,
+                    port.menu_item = self.menu_insert_port_item(
+                        self.section_outputs,
+                        ('sink', name, port.name),
                         port.get_menu_item_title(),
                         port.is_available or port.always_avail)
                     # Bind a click handler
                     port.handler_id = port.menu_item.connect(
                         'activate', self.on_select_port, (CARD_NONE_SINK, index))
 
+        sink.fingerprint = fingerprint
+
         # Update sink's active port, if there's any
-        if data.active_port:
-            port_name = data.active_port.contents.name.decode()
-            logging.debug('    * Activated sink port `%s`', port_name)
-            sink.activate_port_by_name(port_name)
+        if info.active_port:
+            logging.debug('    * Activated sink port `%s`', info.active_port)
+            sink.activate_port_by_name(info.active_port)
+
+            # Update the ports of the card the sink belongs to
+            self.card_update_ports_activity(info.card)
+
+        # Restore the default sink if it's just been rebuilt
+        if self.active_sink is None and name == active_name:
+            self.activate_sink(name)
+            self.card_update_ports_activity(info.card)
 
-            # Update all card ports
-            self.card_update_all_ports_activity()
+        # Proceed with the pending profile switch, if it's been waiting for this sink
+        if info.card in self.profile_switches:
+            self.card_profile_switch_check(info.card)
 
     def sink_remove(self, index: int):
         """Remove a Sink instance by its index (PulseAudio's sink index)."""
@@ -673,10 +955,32 @@ class SoundSwitcherIndicator(GObject.GObject):
             # Remove all sink ports' menu items
             for port in sink.ports.values():
                 if port.menu_item:
-                    self.menu.remove(port.menu_item)
+                    self.menu_remove_item(port.menu_item)
 
-            # Also remove the sink object from sinks[]
+            # Also remove the sink object from sinks[] and its ports from the index
+            self.stream_ports.remove_stream(sink)
             del self.sinks[index]
+            if self.sink_names.get(sink.name) is sink:
+                del self.sink_names[sink.name]
+
+            # If it was the default sink, its card's ports are no longer active
+            if sink is self.active_sink:
+                self.active_sink = None
+                self.card_update_ports_activity(sink.card_index)
+
+    def sink_rekey(self, sink, info: pa_info.StreamInfo):
+        """Re-register a Sink instance under a new index, see pa_reconcile_handler()."""
+        logging.debug('  * Sink[%d] `%s` is now sink[%d]', sink.index, sink.name, info.index)
+        self.stream_ports.remove_stream(sink)
+        sink.index      = info.index
+        sink.card_index = info.card
+        self.sinks[sink.index] = sink
+        self.stream_ports.add_stream(sink)
+
+        # Rebind the menu items' click handlers (only virtual sinks have any)
+        for port in sink.ports.values():
+            if port.menu_item:
+                self.menu_item_rebind(port, (CARD_NONE_SINK, sink.index))
 
     def sink_remove_all(self):
         """Remove all Sink instances."""
@@ -687,19 +991,25 @@ class SoundSwitcherIndicator(GObject.GObject):
     # Sink input list related procs
     # ------------------------------------------------------------------------------------------------------------------
 
-    def sink_input_add(self, index: int, name: str, sink: int):
-        """Register a new SinkInput instance or update an existing one."""
-        # Remove existing sink input with the same index, if any
-        self.sink_input_remove(index)
-        logging.debug('  + Sink input[%d] added: `%s` -> sink %d', index, name, sink)
+    def sink_input_add(self, info: pa_info.StreamClientInfo):
+        """Register a new sink input or update an existing one."""
+        current = self.sink_inputs.get(info.index)
 
-        # Register the new sink input
-        self.sink_inputs[index] = name
+        # Skip the update if nothing has changed
+        if current == info:
+            return
+        logging.debug(
+            '  %s Sink input[%d] %s: `%s` -> sink %d%s',
+            '+' if current is None else '*', info.index, 'added' if current is None else 'updated', info.name,
+            info.stream, ' (corked)' if info.corked else '')
+
+        # Register the new info
+        self.sink_inputs[info.index] = info
 
     def sink_input_remove(self, index: int):
         """Remove a SinkInput instance by its index (PulseAudio's sink input index)."""
         if index in self.sink_inputs:
-            logging.debug('  - Sink input[%d] removed: `%s`', index, self.sink_inputs[index])
+            logging.debug('  - Sink input[%d] removed: `%s`', index, self.sink_inputs[index].name)
 
             # Remove the sink input
             del self.sink_inputs[index]
@@ -713,21 +1023,48 @@ class SoundSwitcherIndicator(GObject.GObject):
     # Source list related procs
     # ------------------------------------------------------------------------------------------------------------------
 
-    def source_info(self, data):
+    def source_info(self, info: pa_info.StreamInfo):
         """Register a new Source instance or update an existing one."""
-        # Fetch properties from the data struct
-        index       = data.index
-        name        = data.name.decode()
-        description = data.description.decode()
+        # Fetch properties from the info
+        index       = info.index
+        name        = info.name
+        description = info.description
+
+        fingerprint = Stream.get_fingerprint(info)
+
+        # Remember the default source, as rebuilding it below resets it, and no server info update is to follow
+        active_name = self.active_source.name if self.active_source is not None else None
+
+        # If it's a virtual source whose configuration has changed, drop it to recreate it from scratch
+        if index in self.sources and self.virtual_stream_changed(self.sources[index], 'sources', self.section_inputs):
+            logging.debug('  * Source[%d] configuration changed, rebuilding', index)
+            self.source_remove(index)
+
+        # Same if the index now refers to a different source, or its card or ports have changed
+        if index in self.sources and self.stream_needs_rebuild(self.sources[index], info):
+            logging.debug('  * Source[%d] `%s` changed, rebuilding', index, name)
+            self.source_remove(index)
 
         # If source already exists, fetch it
         if index in self.sources:
-            logging.debug('  * Source[%d] updated: `%s`, card %d', index, name, data.card)
             source = self.sources[index]
 
+            # Skip the update if nothing relevant has changed
+            if source.fingerprint == fingerprint:
+                logging.debug('  * Source[%d] unchanged: `%s`', index, name)
+                return
+            logging.debug('  * Source[%d] updated: `%s`, card %d', index, name, info.card)
+
+            # Update port availability (the set of ports is the same, see stream_needs_rebuild(); virtual ones only
+            # have a dummy port)
+            for port_info in info.ports:
+                port = source.ports.get(port_info.name)
+                if port is not None:
+                    port.is_available = port_info.is_available
+
         # Otherwise, register a new source object
         else:
-            logging.debug('  + Source[%d] added: `%s`, card %d', index, name, data.card)
+            logging.debug('  + Source[%d] added: `%s`, card %d', index, name, info.card)
 
             # Prepare ports array
             source_ports = {}
@@ -735,7 +1072,7 @@ class SoundSwitcherIndicator(GObject.GObject):
             source_visible = False
 
             # If it's a virtual sink, add a dummy port
-            virtual_card = self.is_virtual_card(data.card)
+            virtual_card = self.is_virtual_card(info.card)
             if virtual_card:
                 port = Port('#dummy_in', None, '', -1, True, True, PA_DIRECTION_INPUT, None, None, False)
                 source_ports[port.name] = port
@@ -743,22 +1080,15 @@ class SoundSwitcherIndicator(GObject.GObject):
                 source_name    = source_cfg['name', '']
                 source_visible = bool(source_cfg['visible', True])
 
-            # Else iterate through ports[] (array of pointers to structs)
-            elif data.ports:
-                idx_port = 0
-                while True:
-                    port_ptr = data.ports[idx_port]
-                    # NULL pointer terminates the array
-                    if not port_ptr:
-                        break
-
-                    port_struct = port_ptr.contents
+            # Else iterate through its ports
+            else:
+                for port_info in info.ports:
                     port = Port(
-                        port_struct.name.decode(),
-                        port_struct.description.decode(),
+                        port_info.name,
+                        port_info.description,
                         '',
-                        port_struct.priority,
-                        port_struct.available != PA_PORT_AVAILABLE_NO,
+                        port_info.priority,
+                        port_info.is_available,
                         False,
                         PA_DIRECTION_INPUT,
                         None,
@@ -768,33 +1098,43 @@ class SoundSwitcherIndicator(GObject.GObject):
                     logging.debug(
                         '    + Source port added: %s; priority: %d; available: %s',
                         port.get_id_text(), port.priority, YESNO[port.is_available])
-                    idx_port += 1
 
             # Create and register a new instance of Source object (this will also set owner_stream in each port)
-            source = Source(index, name, source_name, description, source_ports, data.card)
+            source = Source(index, name, source_name, description, source_ports, info.card)
             self.sources[index] = source
+            self.source_names[name] = source
+            self.stream_ports.add_stream(source)
 
             # If it's a virtual source, create its menu item
-            if virtual_card and source_visible and self.item_header_inputs is not None and \
-                    self.item_separator_inputs is not None:
+            if virtual_card and source_visible and self.section_inputs is not None:
                 for port in source_ports.values():
-                    port.menu_item = self.menu_insert_ordered_item(
-                        self.item_header_inputs,
-                        self.item_separator_inputs,
+                    port.menu_item = self.menu_insert_port_item(
+                        self.section_inputs,
+                        ('source', name, port.name),
                         port.get_menu_item_title(),
                         port.is_available or port.always_avail)
                     # Bind a click handler
                     port.handler_id = port.menu_item.connect(
                         'activate', self.on_select_port, (CARD_NONE_SOURCE, index))
 
+        source.fingerprint = fingerprint
+
         # Update source's active port, if there's any
-        if data.active_port:
-            port_name = data.active_port.contents.name.decode()
-            logging.debug('    * Activated source port `%s`', port_name)
-            source.activate_port_by_name(port_name)
+        if info.active_port:
+            logging.debug('    * Activated source port `%s`', info.active_port)
+            source.activate_port_by_name(info.active_port)
+
+            # Update the ports of the card the source belongs to
+            self.card_update_ports_activity(info.card)
 
-            # Update all card ports
-            self.card_update_all_ports_activity()
+        # Restore the default source if it's just been rebuilt
+        if self.active_source is None and name == active_name:
+            self.activate_source(name)
+            self.card_update_ports_activity(info.card)
+
+        # Proceed with the pending profile switch, if it's been waiting for this source
+        if info.card in self.profile_switches:
+            self.card_profile_switch_check(info.card)
 
     def source_remove(self, index: int):
         """Remove a Source instance by its index (PulseAudio's source index)."""
@@ -805,10 +1145,32 @@ class SoundSwitcherIndicator(GObject.GObject):
             # Remove all source ports' menu items
             for port in source.ports.values():
                 if port.menu_item:
-                    self.menu.remove(port.menu_item)
+                    self.menu_remove_item(port.menu_item)
 
-            # Also remove the source object from sources[]
+            # Also remove the source object from sources[] and its ports from the index
+            self.stream_ports.remove_stream(source)
             del self.sources[index]
+            if self.source_names.get(source.name) is source:
+                del self.source_names[source.name]
+
+            # If it was the default source, its card's ports are no longer active
+            if source is self.active_source:
+                self.active_source = None
+                self.card_update_ports_activity(source.card_index)
+
+    def source_rekey(self, source, info: pa_info.StreamInfo):
+        """Re-register a Source instance under a new index, see pa_reconcile_handler()."""
+        logging.debug('  * Source[%d] `%s` is now source[%d]', source.index, source.name, info.index)
+        self.stream_ports.remove_stream(source)
+        source.index      = info.index
+        source.card_index = info.card
+        self.sources[source.index] = source
+        self.stream_ports.add_stream(source)
+
+        # Rebind the menu items' click handlers (only virtual sources have any)
+        for port in source.ports.values():
+            if port.menu_item:
+                self.menu_item_rebind(port, (CARD_NONE_SOURCE, source.index))
 
     def source_remove_all(self):
         """Remove all Source instances."""
@@ -819,19 +1181,25 @@ class SoundSwitcherIndicator(GObject.GObject):
     # Source output list related procs
     # ------------------------------------------------------------------------------------------------------------------
 
-    def source_output_add(self, index: int, name: str):
-        """Register a new SourceOutput instance or update an existing one."""
-        # Remove existing source output with the same index, if any
-        self.source_output_remove(index)
-        logging.debug('  + Source output[%d] added: `%s`', index, name)
+    def source_output_add(self, info: pa_info.StreamClientInfo):
+        """Register a new source output or update an existing one."""
+        current = self.source_outputs.get(info.index)
+
+        # Skip the update if nothing has changed
+        if current == info:
+            return
+        logging.debug(
+            '  %s Source output[%d] %s: `%s` -> source %d%s',
+            '+' if current is None else '*', info.index, 'added' if current is None else 'updated', info.name,
+            info.stream, ' (corked)' if info.corked else '')
 
-        # Register the new source output
-        self.source_outputs[index] = name
+        # Register the new info
+        self.source_outputs[info.index] = info
 
     def source_output_remove(self, index: int):
         """Remove a SourceOutput instance by its index (PulseAudio's source output index)."""
         if index in self.source_outputs:
-            logging.debug('  - Source output[%d] removed: `%s`', index, self.source_outputs[index])
+            logging.debug('  - Source output[%d] removed: `%s`', index, self.source_outputs[index].name)
 
             # Remove the source output
             del self.source_outputs[index]
@@ -853,128 +1221,239 @@ class SoundSwitcherIndicator(GObject.GObject):
         """Write the configuration out to the corresponding file."""
         self.config.save_to_file(self.config_file_name)
 
+    def keyboard_update(self):
+        """Bring the keyboard bindings in line with the configured shortcuts. The keyboard manager is only created once
+        there's a shortcut configured, and dropped again once there are none left."""
+        if self.shortcuts:
+            if self.keyboard_manager is None:
+                logging.debug('.keyboard_update(): starting keyboard manager for %d shortcut(s)', len(self.shortcuts))
+                self.keyboard_manager = KeyboardManager(self.on_port_keyboard_shortcut)
+            self.keyboard_manager.bind_keys(self.shortcuts)
+
+        elif self.keyboard_manager is not None:
+            logging.debug('.keyboard_update(): no shortcuts configured, stopping keyboard manager')
+            self.keyboard_manager.shutdown()
+            self.keyboard_manager = None
+
     def activate_port(self, idx_card: int, stream_or_port):
-        """Switch input or output to the given port or virtual stream.
+        """Switch input or output to the given port or virtual stream. The switch happens asynchronously.
         :param idx_card:       device index in the cards[] list
         :param stream_or_port: either stream index if idx_card refers to a dummy sink/source, or name of the port on the
                                card given by idx_card
         """
         logging.debug('.activate_port(%d, %s)', idx_card, stream_or_port)
 
+        # While (re)connecting, the indexes are those of the previous context, which may refer to different objects now
+        if not self.pa_populated:
+            logging.info('# Ignoring port selection while connecting to PulseAudio')
+            return
+
+        # Leave it to the switcher, which carries out only the latest of the requests arriving in quick succession
+        self.switcher.request((idx_card, stream_or_port))
+
+    def activate_switch(self, switch: PortSwitch):
+        """Carry out a switch passed on by the switcher, see activate_port().
+        :param switch: switch to carry out
+        """
+        idx_card, stream_or_port = switch.target
+
         # If it's a dummy (virtual) card sink, buf[1] is the sink's index
         if idx_card == CARD_NONE_SINK:
-            port       = None
             idx_stream = stream_or_port
-            stream     = self.sinks[idx_stream]
-            is_output  = True
+            stream     = self.sinks.get(idx_stream)
+            if stream is None:
+                logging.warning('# Failed to find virtual sink[%d]', idx_stream)
+                self.switcher.done(switch)
+                return
             logging.info('# Virtual sink[%d] `%s` selected', idx_stream, stream.name)
+            self.activate_stream(stream, None, switch)
 
         # If it's a dummy (virtual) card source, buf[1] is the source's index
         elif idx_card == CARD_NONE_SOURCE:
-            port       = None
             idx_stream = stream_or_port
-            stream     = self.sources[idx_stream]
-            is_output  = False
+            stream     = self.sources.get(idx_stream)
+            if stream is None:
+                logging.warning('# Failed to find virtual source[%d]', idx_stream)
+                self.switcher.done(switch)
+                return
             logging.info('# Virtual source[%d] `%s` selected', idx_stream, stream.name)
+            self.activate_stream(stream, None, switch)
 
         # Otherwise, it's a real device and buf[1] is the port's name
         else:
             port_name = stream_or_port
 
             # Find the card and validate its port
-            card = self.cards[idx_card]
-            if port_name not in card.ports:
-                logging.warning('# Failed to find port `%s` on card `%s`', port_name, card.name)
+            card = self.cards.get(idx_card)
+            if card is None or port_name not in card.ports:
+                logging.warning('# Failed to find port `%s` on card[%d]', port_name, idx_card)
+                self.switcher.done(switch)
                 return
 
             port = card.ports[port_name]
-            is_output = port.is_output
             logging.info('# Card[%d], port %s selected', idx_card, port.get_id_text())
 
             # Try to find a matching stream
-            stream = card.find_stream_port(port, self.sources, self.sinks)[0]
-
-            # Switch profile if necessary
-            if self.card_switch_profile(port, stream is not None):
-                # Profile is changed: retry searching for the stream
-                stream = card.find_stream_port(port, self.sources, self.sinks)[0]
-
-            # If no stream found, that's an error
-            if stream is None:
-                logging.error('Failed to map card[%d], port `%s` to a stream', idx_card, port_name)
-                return
+            stream = card.find_stream_port(port, self.stream_ports)[0]
+
+            # Switch profile if necessary. Once it's changed, retry searching for the stream
+            if not self.card_switch_profile(
+                    port, stream is not None,
+                    lambda: self.activate_card_port(card, port, switch),
+                    lambda: self.switcher.done(switch)):
+                self.activate_card_port(card, port, switch)
+
+    def activate_card_port(self, card, port, switch: PortSwitch):
+        """Switch input or output to the stream the given card port maps to.
+        :param card:   card the port belongs to
+        :param port:   card port to switch to
+        :param switch: switch in progress
+        """
+        stream = card.find_stream_port(port, self.stream_ports)[0]
+
+        # If no stream found, that's an error
+        if stream is None:
+            logging.error('Failed to map card[%d], port `%s` to a stream', card.index, port.name)
+            self.switcher.done(switch)
+            return
+
+        self.activate_stream(stream, port, switch)
+
+    def activate_stream(self, stream, port, switch: PortSwitch):
+        """Make the given sink or source the default one, activate its port and move all sink inputs or source outputs
+        over to it. The operations are all issued at once: PulseAudio handles the requests of a connection in order, so
+        they're still carried out one after another, but without waiting for a round trip each.
+        :param stream: sink or source to switch to
+        :param port:   card port to activate on the stream, or None for virtual streams
+        :param switch: switch in progress
+        """
+        steps = []
 
         # Switching output
-        if is_output:
+        if isinstance(stream, Sink):
             # Change the default sink
-            self.synchronise_op(
+            steps.append((
                 'pa_context_set_default_sink()',
-                pa_context_set_default_sink(self.pa_context, stream.name.encode(), self._pacb_context_success, None)
-            )
+                lambda ctx, ud: pa_context_set_default_sink(ctx, stream.name.encode(), self._pacb_context_success, ud),
+                None))
 
             # Change the active port, if it's not a dummy one
             if port is not None and not port.is_dummy:
-                pa_context_set_sink_port_by_index(
-                    self.pa_context, stream.index, port.name.encode(), self._pacb_context_success, None)
-
-            # Move all active sink inputs to the selected sink
-            for idx in self.sink_inputs.keys():
-                self.synchronise_op(
-                    'pa_context_move_sink_input_by_index()',
-                    pa_context_move_sink_input_by_index(
-                        self.pa_context, idx, stream.index, self._pacb_context_success, None))
+                steps.append((
+                    'pa_context_set_sink_port_by_index()',
+                    lambda ctx, ud: pa_context_set_sink_port_by_index(
+                        ctx, stream.index, port.name.encode(), self._pacb_context_success, ud),
+                    None))
+
+            # Move all sink inputs to the selected sink, unless they're on it already
+            for idx in [info.index for info in self.sink_inputs.values() if info.stream != stream.index]:
+                steps.append((
+                    'pa_context_move_sink_input_by_index({})'.format(idx),
+                    lambda ctx, ud, idx=idx: pa_context_move_sink_input_by_index(
+                        ctx, idx, stream.index, self._pacb_context_success, ud),
+                    None))
 
         # Switching input
         else:
             # Change the default source
-            self.synchronise_op(
+            steps.append((
                 'pa_context_set_default_source()',
-                pa_context_set_default_source(
-                    self.pa_context, stream.name.encode(), self._pacb_context_success, None))
+                lambda ctx, ud: pa_context_set_default_source(
+                    ctx, stream.name.encode(), self._pacb_context_success, ud),
+                None))
 
             # Change the active port, if it's not a dummy one
             if port is not None and not port.is_dummy:
-                self.synchronise_op(
+                steps.append((
                     'pa_context_set_source_port_by_index()',
-                    pa_context_set_source_port_by_index(
-                        self.pa_context, stream.index, port.name.encode(), self._pacb_context_success, None))
-
-            # Move all active source outputs to the selected source
-            for idx in self.source_outputs.keys():
-                self.synchronise_op(
-                    'pa_context_move_source_output_by_index()',
-                    pa_context_move_source_output_by_index(
-                        self.pa_context, idx, stream.index, self._pacb_context_success, None))
+                    lambda ctx, ud: pa_context_set_source_port_by_index(
+                        ctx, stream.index, port.name.encode(), self._pacb_context_success, ud),
+                    None))
+
+            # Move all source outputs to the selected source, unless they're on it already
+            for idx in [info.index for info in self.source_outputs.values() if info.stream != stream.index]:
+                steps.append((
+                    'pa_context_move_source_output_by_index({})'.format(idx),
+                    lambda ctx, ud, idx=idx: pa_context_move_source_output_by_index(
+                        ctx, idx, stream.index, self._pacb_context_success, ud),
+                    None))
+
+        self.pa_ops.submit_group(
+            steps, lambda group: self.activate_stream_done(group, stream, switch), self.pa_op_timeout)
+
+    def activate_stream_done(self, group, stream, switch: PortSwitch):
+        """Completion callback of activate_stream(): report the outcome of the switch and let the next one through.
+        :param group:  PAOperationGroup of the switch operations
+        :param stream: sink or source switched to
+        :param switch: switch in progress
+        """
+        for op in group.ops:
+            logging.debug('  . `%s` %s in %.3f ms', op.name, op.state, op.duration * 1000)
+        failed = [op.name for op in group.ops if not op.succeeded]
+        latency = switch.get_latency() * 1000
+        if failed:
+            logging.warning(
+                'Switching to `%s` finished in %.3f ms, %d of %d step(s) failed: %s',
+                stream.name, latency, len(failed), len(group.ops), ', '.join(failed))
+        else:
+            logging.info('Switched to `%s` in %.3f ms (%d step(s))', stream.name, latency, len(group.ops))
+        self.switcher.done(switch)
 
     def activate_sink(self, name: str):
         """Activate a sink by its name."""
         logging.debug('* Activated sink: `%s`', name)
-        for sink in self.sinks.values():
-            sink.is_active = sink.name == name
+        sink = self.sink_names.get(name)
+        if sink is not self.active_sink:
+            if self.active_sink is not None:
+                self.active_sink.is_active = False
+            self.active_sink = sink
+            if sink is not None:
+                sink.is_active = True
 
     def activate_source(self, name: str):
         """Activate a source by its name."""
         logging.debug('* Activated source: `%s`', name)
-        for source in self.sources.values():
-            source.is_active = source.name == name
+        source = self.source_names.get(name)
+        if source is not self.active_source:
+            if self.active_source is not None:
+                self.active_source.is_active = False
+            self.active_source = source
+            if source is not None:
+                source.is_active = True
+
+    def server_info(self, info: pa_info.ServerInfo):
+        """Update the default sink and source according to the server info."""
+        # Remember the cards the current default sink and source belong to
+        card_indexes = [stream.card_index for stream in self.get_active_streams()]
+
+        self.activate_sink  (info.default_sink_name)
+        self.activate_source(info.default_source_name)
+
+        # Update port status on the cards of both the previous and the new default sink and source
+        card_indexes.extend(stream.card_index for stream in self.get_active_streams())
+        self.card_update_ports_activity(*card_indexes)
+        self.menu_cache_schedule_save()
+
+    def get_active_streams(self) -> list:
+        """Return the list of the currently active (default) sink and source, if any."""
+        return [stream for stream in (self.active_sink, self.active_source) if stream is not None]
 
     def find_card_port_by_name(self, card_name: str, port_name: str) -> tuple:
         """Find a card and its port by their names, and return both as a tuple. If the card is found and the port isn't,
         return (card, None); if neither is found, return (None, None)."""
-        # Iterate known cards
-        for idx, card in self.cards.items():
-            if card.name == card_name:
-                # If the port isn't found for the card, return only the card
-                if port_name not in card.ports:
-                    logging.warning('# Failed to find port `%` on card `%s`', port_name, card_name)
-                    return card, None
+        # Look the card up
+        card = self.card_names.get(card_name)
+        if card is None:
+            logging.warning('Failed to find card `%s` among the available devices', card_name)
+            return None, None
 
-                # Return the card and the port
-                return card, card.ports[port_name]
+        # If the port isn't found for the card, return only the card
+        if port_name not in card.ports:
+            logging.warning('# Failed to find port `%s` on card `%s`', port_name, card_name)
+            return card, None
 
-        # Card not found
-        logging.warning('Failed to find card `%s` among the available devices', card_name)
-        return None, None
+        # Return the card and the port
+        return card, card.ports[port_name]
 
     @staticmethod
     def run():
@@ -982,30 +1461,46 @@ class SoundSwitcherIndicator(GObject.GObject):
         # Run the main event loop
         Gtk.main()
 
-    def menu_append_item(self, label: str = None, activate_signal: callable = None):
-        """Add a menu or separator item to the indicator menu.
+    @staticmethod
+    def menu_create_item(label: str = None, activate_signal: callable = None):
+        """Create a menu or separator item for the indicator menu.
         :param label: text label for the item. If None, a separator menu item is created.
         :param activate_signal: activate signal handler. If None,  the item will be greyed out.
         :return: the created item
         """
         if label is None:
-            logging.debug('.menu_append_item(): appending separator')
             item = Gtk.SeparatorMenuItem()
         else:
-            logging.debug('.menu_append_item(): appending item `%s`', label)
             item = Gtk.MenuItem.new_with_mnemonic(label)
             if activate_signal is not None:
                 item.connect("activate", activate_signal, None)
             else:
                 item.set_sensitive(False)
         item.show()
-        self.menu.append(item)
         return item
 
-    def menu_insert_ordered_item(self, after_item, before_item, label: str, show: bool):
+    def menu_append_item(self, label: str = None, activate_signal: callable = None):
+        """Add a menu or separator item to the indicator menu.
+        :param label: text label for the item. If None, a separator menu item is created.
+        :param activate_signal: activate signal handler. If None,  the item will be greyed out.
+        :return: the created item
+        """
+        logging.debug('.menu_append_item(): appending %s', 'separator' if label is None else 'item `{}`'.format(label))
+        item = self.menu_create_item(label, activate_signal)
+        self.menu_model.append_item(item)
+        return item
+
+    def menu_append_section(self, label: str) -> MenuSection:
+        """Add a section for radio items to the indicator menu.
+        :param label: text label for the section header
+        :return: the created section
+        """
+        logging.debug('.menu_append_section(): appending section `%s`', label)
+        return self.menu_model.append_section(self.menu_create_item(label), self.menu_create_item())
+
+    def menu_insert_ordered_item(self, section: MenuSection, label: str, show: bool):
         """Insert a new menu item into the indicator menu while maintaining the alphabetical order of the items.
-        :param after_item: the item to insert after, or None if unbounded
-        :param before_item: the item to insert before, or None if unbounded
+        :param section: the section to insert the item into
         :param label: text label for the item
         :param show: whether to make the newly inserted item visible
         :return: the created item
@@ -1013,52 +1508,120 @@ class SoundSwitcherIndicator(GObject.GObject):
         # Indent the label a little
         label = "    " + label
 
-        # Find out item indexes
-        items = self.menu.get_children()
-        idx_from = 0 if after_item is None else items.index(after_item) + 1
-        idx_to   = items.index(before_item)
-
-        # If there's at least one item, get the group from it
-        group = [] if idx_to == idx_from else items[idx_from].get_group()
-
-        # Create and set up a new radio item
-        new_item = Gtk.RadioMenuItem.new_with_mnemonic(group, label)
+        # Create and set up a new radio item, joining the section's group
+        new_item = Gtk.RadioMenuItem.new_with_mnemonic(section.get_group(), label)
         if show:
             new_item.show()
 
-        # Find an appropriate position for the item so that they are in alphabetical order
-        i = idx_from
-        while (i < idx_to) and (label >= items[i].get_label()):
-            i += 1
-
-        # Insert the item
-        logging.debug(
-            '.menu_insert_ordered_item(): inserting item `%s` at index %d%s',
-            label, i, ' (hidden)' if not show else '')
-        self.menu.insert(new_item, i)
+        # Insert the item so that the section's items are in alphabetical order
+        self.menu_model.insert_ordered_item(section, label, new_item)
         return new_item
 
+    def menu_insert_port_item(self, section: MenuSection, key: tuple, label: str, show: bool):
+        """Provide a menu item for a port, taking over the item restored from the menu cache if it matches.
+        :param section: the section the item belongs to
+        :param key: tuple of (kind, owner name, port name) identifying the port, see MenuCache
+        :param label: text label for the item
+        :param show: whether the item is to be visible
+        :return: the item
+        """
+        self.menu_cache_schedule_save()
+
+        # Try to reuse the pending item, provided it's in the same section and looks the same
+        section_item = self.pending_items.pop(key, None)
+        if section_item is not None:
+            pending_section, item = section_item
+            if pending_section is section and item.get_label() == '    ' + label:
+                logging.debug('.menu_insert_port_item(): taking over cached item `%s`', label)
+                item.set_sensitive(True)
+                item.set_visible(show)
+                return item
+            self.menu_remove_item(item)
+        return self.menu_insert_ordered_item(section, label, show)
+
+    def menu_item_rebind(self, port, data):
+        """Reconnect the click handler of the given port's menu item with new user data."""
+        port.menu_item.disconnect(port.handler_id)
+        port.handler_id = port.menu_item.connect('activate', self.on_select_port, data)
+
+    def menu_remove_item(self, item):
+        """Remove an item inserted by menu_insert_ordered_item() from the indicator menu."""
+        self.menu_model.remove_item(item)
+        self.menu_cache_schedule_save()
+
+    def menu_load_cache(self):
+        """Fill the menu with the port items stored in the menu cache. The items are disabled until they're taken over
+        by the corresponding ports once the daemon's state is known, see menu_insert_port_item()."""
+        for entry in self.menu_cache.load():
+            section = self.section_outputs if entry.get('output') else self.section_inputs
+            if section is not None:
+                item = self.menu_insert_ordered_item(section, entry['label'], bool(entry.get('show', True)))
+                item.set_sensitive(False)
+                if entry.get('active'):
+                    item.set_active(True)
+                self.pending_items[tuple(entry['key'])] = (section, item)
+        profiler.mark('cached menu shown')
+
+    def menu_drop_pending_items(self):
+        """Remove the items restored from the menu cache that haven't been taken over by any port."""
+        if self.pending_items:
+            logging.debug('.menu_drop_pending_items(): dropping %d stale cached item(s)', len(self.pending_items))
+            for section, item in self.pending_items.values():
+                self.menu_model.remove_item(item)
+            self.pending_items.clear()
+
+    def menu_cache_snapshot(self) -> list:
+        """Describe the port items currently in the menu.
+        :return: list of entries, see MenuCache
+        """
+        ports = []
+        for card in self.cards.values():
+            ports.extend(('card', card.name, port) for port in card.ports.values())
+        for sink in self.sinks.values():
+            ports.extend(('sink', sink.name, port) for port in sink.ports.values())
+        for source in self.sources.values():
+            ports.extend(('source', source.name, port) for port in source.ports.values())
+        return [
+            {
+                'key':    [kind, owner_name, port.name],
+                'output': port.is_output,
+                'label':  port.get_menu_item_title(),
+                'show':   port.is_available or port.always_avail,
+                'active': port.is_active,
+            }
+            for kind, owner_name, port in ports if port.menu_item is not None]
+
+    def menu_cache_schedule_save(self):
+        """Schedule saving the menu cache, unless it's already scheduled."""
+        if self.menu_cache_save_id is None:
+            self.menu_cache_save_id = GLib.timeout_add(MENU_CACHE_SAVE_DELAY_MS, self.menu_cache_save)
+
+    def menu_cache_save(self) -> bool:
+        """Save the menu cache, provided the menu reflects the daemon's state."""
+        if self.menu_cache_save_id is not None:
+            GLib.source_remove(self.menu_cache_save_id)
+            self.menu_cache_save_id = None
+        if self.pa_context_connected and not self.pa_connecting and not self.pending_items:
+            self.menu_cache.save(self.menu_cache_snapshot())
+
+        # Prevent this method from being called again
+        return False
+
     def menu_setup(self):
         """Initialise the indicator menu."""
         # Remove all menu items
-        for item in self.menu.get_children():
-            self.menu.remove(item)
+        self.menu_model.clear()
+        self.pending_items.clear()
+
+        # Make the status item
+        self.item_status = self.menu_append_item('')
+        self.menu_set_status(self.menu_status)
 
         # Make the input list section, if needed
-        if bool(self.config['show_inputs', True]):
-            self.item_header_inputs = self.menu_append_item(_('Inputs'))
-            self.item_separator_inputs = self.menu_append_item()
-        else:
-            self.item_header_inputs = None
-            self.item_separator_inputs = None
+        self.section_inputs  = self.menu_append_section(_('Inputs'))  if self.config['show_inputs',  True] else None
 
         # Make the output list section, if needed
-        if bool(self.config['show_outputs', True]):
-            self.item_header_outputs = self.menu_append_item(_('Outputs'))
-            self.item_separator_outputs = self.menu_append_item()
-        else:
-            self.item_header_outputs = None
-            self.item_separator_outputs = None
+        self.section_outputs = self.menu_append_section(_('Outputs')) if self.config['show_outputs', True] else None
 
         # Add static items
         self.menu_append_item(_('_Refresh'),      self.on_refresh)
@@ -1066,62 +1629,221 @@ class SoundSwitcherIndicator(GObject.GObject):
         self.menu_append_item(_('_About'),        self.on_about)
         self.menu_append_item(_('_Quit'),         self.on_quit)
 
-    def pulseaudio_connect(self):
-        """Try to connect to the PulseAudio daemon up to PULSEAUDIO_MAX_RETRIES times. Exit the app if failed."""
-        self.pa_connecting = True
-        try:
-            # Cleanup and refill the menu with 'static' items
-            self.menu_setup()
-
-            # Loop until we have a connection
-            attempt = 1
-            succeeded = False
-            while attempt <= PULSEAUDIO_MAX_RETRIES:
-                # Try to establish a connection
-                logging.debug('Trying to connect to PulseAudio daemon, attempt #%d', attempt)
-                succeeded = self.pulseaudio_initialise()
-                if succeeded:
-                    break
-                # Sleep 2 seconds on a failure
-                time.sleep(2)
-                attempt += 1
-
-            # If connection succeeded
-            if succeeded:
-                # Update PulseAudio environment info
-                self.update_pa_items()
-
-                # Subscribe to context-specific daemon state changes
-                self.synchronise_op(
-                    'pa_context_subscribe()',
-                    pa_context_subscribe(
-                        self.pa_context,
-                        PA_SUBSCRIPTION_MASK_CARD       |
-                        PA_SUBSCRIPTION_MASK_SINK       |
-                        PA_SUBSCRIPTION_MASK_SINK_INPUT |
-                        PA_SUBSCRIPTION_MASK_SERVER     |
-                        PA_SUBSCRIPTION_MASK_SOURCE     |
-                        PA_SUBSCRIPTION_MASK_SOURCE_OUTPUT,
-                        self._pacb_context_success,
-                        None))
-                pa_context_set_subscribe_callback(self.pa_context, self._pacb_context_subscribe, None)
-
-            # Cleanup otherwise
+    def menu_set_status(self, label: str = None):
+        """Display the given status text at the top of the menu.
+        :param label: status text, or None to hide the status item
+        """
+        self.menu_status = label
+        if self.item_status is not None:
+            if label is None:
+                self.item_status.hide()
             else:
-                logging.critical('Failed to connect to PulseAudio, exiting')
+                self.item_status.set_label(label)
+                self.item_status.show()
+
+    def menu_sections_changed(self) -> bool:
+        """Check whether the set of menu sections no longer matches the configuration."""
+        return \
+            bool(self.config['show_inputs',  True]) != (self.section_inputs  is not None) or \
+            bool(self.config['show_outputs', True]) != (self.section_outputs is not None)
+
+    def pulseaudio_connect(self, started: bool = False) -> bool:
+        """Start (re)connecting to the PulseAudio daemon. Connection attempts are repeated, with an exponentially
+        growing delay, until one succeeds.
+        :param started: whether the first attempt has already been started, see __init__(). If so, it's carried on with
+                        rather than started over
+        """
+        if not started:
+            self.pa_connecting = True
+            self.pa_retry_attempt = 0
+        if self.pa_retry_id is not None:
+            GLib.source_remove(self.pa_retry_id)
+            self.pa_retry_id = None
+        self.pulseaudio_cancel_connect_timeout()
+
+        with self.menu_model.transaction('reconnect'):
+            # Release the previous context, if any, cancelling all operations pending on it
+            if not started:
                 self.pulseaudio_shutdown()
+            self.pa_populated = False
 
-        finally:
-            self.pa_connecting = False
+            # Fill the menu with 'static' items, unless it's already set up. Existing items are kept as a stale snapshot
+            # to be reconciled with the daemon's state once connected
+            if self.item_status is None or self.menu_sections_changed():
+                self.pa_items_remove_all()
+                self.menu_setup()
 
-        # Exit the app if there's no connection
-        if not succeeded:
-            exit(10)
+                # Show the port items last seen, until the daemon reports the current ones
+                self.menu_load_cache()
+            self.menu_set_status(_('Connecting to PulseAudio…'))
+
+        # Make the first attempt right away, unless it's underway already
+        if not started:
+            self.pulseaudio_try_connect()
+
+        # Carry on right away if the context has got ready in the meantime. The state change notification, which is
+        # still to come, will be ignored then
+        elif self.pa_context_connected:
+            self.pulseaudio_connected()
+
+        # Otherwise wait for it to get ready, but no longer than the connect timeout
+        else:
+            self.pulseaudio_start_connect_timeout()
+
+        # Prevent this method from being called again (when used as an idle callback)
+        return False
+
+    def pulseaudio_try_connect(self) -> bool:
+        """Make an attempt to connect to the PulseAudio daemon. The outcome is reported by the context state callback,
+        see pulseaudio_context_changed()."""
+        self.pa_retry_id = None
+        self.pa_retry_attempt += 1
+        logging.debug('Trying to connect to PulseAudio daemon, attempt #%d', self.pa_retry_attempt)
+
+        # If connecting started, wait for the context to get ready or fail, but no longer than the connect timeout
+        if self.pulseaudio_initialise():
+            self.pulseaudio_start_connect_timeout()
+
+        # Retry later otherwise
+        else:
+            self.pulseaudio_retry()
+
+        # Prevent this method from being called again
+        return False
+
+    def pulseaudio_retry(self):
+        """Clean up after a failed connection attempt and schedule the next one."""
+        self.pulseaudio_cancel_connect_timeout()
+        self.pulseaudio_shutdown()
+        delay = self.get_retry_delay(self.pa_retry_attempt)
+        logging.warning('Failed to connect to PulseAudio, retrying in %d ms', delay)
+        self.pa_retry_id = GLib.timeout_add(delay, self.pulseaudio_try_connect)
+
+    def pulseaudio_connect_timed_out(self) -> bool:
+        """Give up a connection attempt the context hasn't got ready within the connect timeout for."""
+        self.pa_connect_timeout_id = None
+        logging.warning('PulseAudio context not ready after %d ms', self.pa_conn_timeout)
+        self.pulseaudio_retry()
+
+        # Prevent this method from being called again
+        return False
+
+    def pulseaudio_start_connect_timeout(self):
+        """Start waiting for the context to get ready, if the connect timeout is set."""
+        if self.pa_conn_timeout:
+            self.pa_connect_timeout_id = GLib.timeout_add(self.pa_conn_timeout, self.pulseaudio_connect_timed_out)
+
+    def pulseaudio_cancel_connect_timeout(self):
+        """Stop waiting for the context to get ready."""
+        if self.pa_connect_timeout_id is not None:
+            GLib.source_remove(self.pa_connect_timeout_id)
+            self.pa_connect_timeout_id = None
+
+    def pulseaudio_context_changed(self, serial: int, ctxstate: int) -> bool:
+        """Handle a context state change reported by pacb_context_notify(). Always runs on the GUI thread.
+        :param serial: serial number of the context the change relates to
+        :param ctxstate: new state of the context, either PA_CONTEXT_READY or PA_CONTEXT_FAILED
+        """
+        # Ignore changes reported for a context that has been dropped in the meantime
+        if serial == self.pa_context_serial and self.pa_context is not None:
+            # The connection attempt is over
+            if self.pa_connecting:
+                if ctxstate == PA_CONTEXT_READY:
+                    self.pulseaudio_connected()
+                else:
+                    self.pulseaudio_retry()
+
+            # An established connection failed, try to reconnect
+            elif ctxstate == PA_CONTEXT_FAILED:
+                logging.info('Reconnecting to PulseAudio')
+                self.pulseaudio_connect()
+
+        # Prevent this method from being called again
+        return False
+
+    def pulseaudio_connected(self):
+        """Finish setting up a newly established connection to the PulseAudio daemon."""
+        logging.info('Connected to PulseAudio after %d attempt(s)', self.pa_retry_attempt)
+        profiler.end('PulseAudio connection')
+        self.pulseaudio_cancel_connect_timeout()
+        self.pa_connecting = False
+        self.menu_set_status(None)
+
+        # Subscribe to context-specific daemon state changes
+        with self.pa_ops.locked():
+            pa_context_set_subscribe_callback(self.pa_context, self._pacb_context_subscribe, None)
+        self.pa_ops.submit(
+            'pa_context_subscribe()',
+            lambda ctx, ud: pa_context_subscribe(
+                ctx,
+                PA_SUBSCRIPTION_MASK_CARD       |
+                PA_SUBSCRIPTION_MASK_SINK       |
+                PA_SUBSCRIPTION_MASK_SINK_INPUT |
+                PA_SUBSCRIPTION_MASK_SERVER     |
+                PA_SUBSCRIPTION_MASK_SOURCE     |
+                PA_SUBSCRIPTION_MASK_SOURCE_OUTPUT,
+                self._pacb_context_success,
+                ud),
+            timeout_ms=self.pa_op_timeout)
+
+        # Update PulseAudio environment info. The first time the menu is populated concludes the startup
+        profiler.begin('initial update')
+        self.pulseaudio_populate()
+
+    def pulseaudio_populate(self):
+        """Fetch all PulseAudio items following connecting to the daemon."""
+        serial = self.pa_context_serial
+        self.menu_model.freeze('populate')
+        self.update_pa_items(on_done=lambda group: self.pulseaudio_populated(group, serial))
+
+    def pulseaudio_populated(self, group, serial: int):
+        """Completion callback of the update of PulseAudio items following connecting to the daemon.
+        :param group:  PAOperationGroup of the update requests
+        :param serial: serial number of the context the update has been requested on
+        """
+        # The update is cancelled when the context is dropped, and its results are of no use then
+        if serial != self.pa_context_serial or self.pa_connecting:
+            logging.debug('.pulseaudio_populated(): context %d is gone, ignoring', serial)
+            self.menu_model.commit()
+            return
+
+        # Retry if any of the requests has failed: the items don't reflect the daemon's state yet
+        if not group.succeeded:
+            logging.warning('Failed to fetch the PulseAudio state, retrying')
+            self.menu_model.commit()
+            self.pulseaudio_populate()
+            return
+
+        # Cached items not taken over by now belong to ports that are gone
+        self.menu_drop_pending_items()
+        self.menu_model.commit()
+        self.pa_populated = True
+        self.menu_cache_schedule_save()
+
+        profiler.end('initial update')
+        profiler.mark('menu populated')
+        profiler.finish()
+
+    @staticmethod
+    def get_retry_delay(attempt: int) -> int:
+        """Compute the delay before the next attempt to connect to the PulseAudio daemon, using exponential backoff
+        with jitter.
+        :param attempt: number of failed attempts so far
+        :return: delay in milliseconds
+        """
+        delay = min(PULSEAUDIO_RETRY_DELAY_MS * 2 ** min(attempt - 1, 16), PULSEAUDIO_RETRY_MAX_DELAY_MS)
+        return int(delay * random.uniform(1 - PULSEAUDIO_RETRY_JITTER, 1 + PULSEAUDIO_RETRY_JITTER))
 
     def pulseaudio_initialise(self):
-        """Initialise PulseAudio context and related objects.
-        :return: True if succeeded
+        """Initialise PulseAudio context and related objects, and start connecting the context.
+        :return: True if connecting has started
         """
+        # Resolve all libpulse functions up front, so that a missing one is reported here rather than failing once it's
+        # first called, possibly on the PulseAudio thread
+        missing = resolve_all()
+        if missing:
+            logging.error('Functions missing from libpulse: %s', ', '.join(missing))
+
         # Create PulseAudio's main loop
         self.pa_mainloop = pa_threaded_mainloop_new()
         self.pa_mainloop_api = pa_threaded_mainloop_get_api(self.pa_mainloop)
@@ -1129,31 +1851,34 @@ class SoundSwitcherIndicator(GObject.GObject):
         # Create and connect PulseAudio context
         self.pa_context = pa_context_new(self.pa_mainloop_api, APP_NAME.encode())
         self.pa_context_connected = False
-        self.pa_context_failed    = False
+        self.pa_context_serial   += 1
         pa_context_set_state_callback(self.pa_context, self._pacb_context_notify, None)
-        pa_context_connect(self.pa_context, None, 0, None)
+        if pa_context_connect(self.pa_context, None, 0, None) < 0:
+            return False
+        self.pa_ops.attach(self.pa_mainloop, self.pa_context)
 
         # Start the main loop
-        pa_threaded_mainloop_start(self.pa_mainloop)
-
-        # Wait until the context is connected or failed, up to 2 seconds
-        cnt = 0
-        while cnt < 20 and not (self.pa_context_connected or self.pa_context_failed):
-            # Prevent CPU maxout
-            time.sleep(0.1)
-            cnt += 1
-
-        return self.pa_context_connected
+        return pa_threaded_mainloop_start(self.pa_mainloop) >= 0
 
     def pulseaudio_shutdown(self):
         """Clean up PulseAudio context and related objects."""
+        # Drop any switches in progress first, so that cancelling their operations doesn't start the next one on the
+        # context being disposed of
+        self.switcher.clear()
+        for card_index in list(self.profile_switches.keys()):
+            self.card_profile_switch_cancel(card_index)
+
+        # Drop any events and operations pending for the context
+        self.event_queue.clear()
+        self.change_limiter.clear()
+        self.pa_ops.detach()
+
         # Disconnect and free the context
-        if self.pa_context_connected:
-            pa_context_disconnect(self.pa_context)
-            self.pa_context_connected = False
         if self.pa_context is not None:
+            pa_context_disconnect(self.pa_context)
             pa_context_unref(self.pa_context)
             self.pa_context = None
+        self.pa_context_connected = False
 
         # Stop main loop thread
         if self.pa_mainloop is not None:
@@ -1163,89 +1888,180 @@ class SoundSwitcherIndicator(GObject.GObject):
 
     def shutdown(self):
         """Shut down the application."""
-        # Close the Preferences dialog if it's open
-        PreferencesDialog.quit()
-
-        # Shutdown PulseAudio
+        # Close the Preferences dialog if it's open, which is only possible if it's ever been loaded
+        prefs = sys.modules.get(__package__ + '.prefs')
+        if prefs is not None:
+            prefs.PreferencesDialog.quit()
+
+        # Stop reconnecting and shutdown PulseAudio
+        if self.pa_retry_id is not None:
+            GLib.source_remove(self.pa_retry_id)
+            self.pa_retry_id = None
+        self.pulseaudio_cancel_connect_timeout()
+
+        # Save the menu cache right away if it's due
+        if self.menu_cache_save_id is not None:
+            self.menu_cache_save()
         self.pulseaudio_shutdown()
 
         # Shutdown the keyboard manager
-        if self.keyboard_manager:
+        if self.keyboard_manager is not None:
             self.keyboard_manager.shutdown()
 
+        # Output the startup profile if the startup has been cut short
+        profiler.finish()
+
         # Quit
         Gtk.main_quit()
 
-    def synchronise_op(self, name: str, operation):
-        """Turn an asynchronous PulseAudio operation into a synchronous one by waiting on the operation to complete.
-        Finally, dereference the operation object.
-        :param name: operation name for logging purposes
-        :param operation: PulseAudio operation to execute
+    @staticmethod
+    def pa_results_handler(apply: callable) -> callable:
+        """Make a PulseAudio operation completion callback that passes every data item delivered by the operation on to
+        the given function.
+        :param apply: function accepting a single data item, such as CardInfo
+        :return: the callback
         """
-        # Check that there's a successful operation passed
-        if not operation:
-            logging.error('PulseAudio operation failed: `%s`', name)
-
-        # Lock the main loop. According to the official PA documentation this ought to happen before the operation is
-        # created, but since we only have one worker thread (Gtk thread), no race for PA mainloop is expected and this
-        # should do
-        pa_threaded_mainloop_lock(self.pa_mainloop)
-
-        # Wait on the operation
-        while pa_operation_get_state(operation) == PA_OPERATION_RUNNING:
-            pa_threaded_mainloop_wait(self.pa_mainloop)
+        def handler(op: PAOperation):
+            for item in op.results:
+                apply(item)
+        return handler
+
+    def pa_items_remove_all(self):
+        """Remove all PulseAudio items along with their menu items."""
+        self.card_remove_all()
+        self.source_remove_all()
+        self.source_output_remove_all()
+        self.sink_remove_all()
+        self.sink_input_remove_all()
 
-        # Free the operation object
-        pa_operation_unref(operation)
-
-        # Unlock the main loop
-        pa_threaded_mainloop_unlock(self.pa_mainloop)
+    @staticmethod
+    def pa_reconcile_handler(items: dict, remove: callable, apply: callable, rekey: callable = None) -> callable:
+        """Make a completion callback for a PulseAudio list operation that reconciles the given items with the list
+        delivered by the operation: items missing from the list are removed, the others are added or updated. If the
+        operation fails, the items are left intact.
+        :param items: dict of the existing items, keyed by their PulseAudio index
+        :param remove: function removing an existing item by its index
+        :param apply: function accepting a single data item, such as CardInfo, and adding or updating the item
+        :param rekey: optional function accepting an existing item and the data item with the same name but a different
+                      index, which re-registers the item under the new index. Items are only matched by name if it's
+                      given
+        :return: the callback
+        """
+        def handler(op: PAOperation):
+            if not op.succeeded:
+                logging.warning('Keeping the current state since `%s` did not succeed', op.name)
+                return
 
-    def update_pa_items(self, update_cards=True, update_sources=True, update_sinks=True, update_server=True):
-        """Synchronously update information about PulseAudio items: cards, sinks, sources, server etc."""
+            # Items that have got a new index (which happens when the daemon is restarted) retain their state
+            if rekey is not None:
+                infos = {info.name: info for info in op.results}
+                moved = [item for item in items.values() if item.name in infos and infos[item.name].index != item.index]
+                for item in moved:
+                    del items[item.index]
+                for item in moved:
+                    info = infos[item.name]
+                    # Whatever is still registered under the new index isn't there anymore
+                    remove(info.index)
+                    rekey(item, info)
+
+            indexes = {item.index for item in op.results}
+            for index in [index for index in items if index not in indexes]:
+                remove(index)
+            for item in op.results:
+                apply(item)
+        return handler
+
+    def update_pa_items(
+            self, update_cards=True, update_sources=True, update_sinks=True, update_server=True,
+            on_done: callable = None):
+        """Asynchronously update information about PulseAudio items: cards, sinks, sources, server etc. All the requests
+        are issued at once, and their results are reconciled with the existing items in the order of dependency once all
+        of them are complete: cards, then streams, then server defaults.
+        :param on_done: optional callback receiving the PAOperationGroup of the requests once the update is complete
+        """
         logging.debug('.update_pa_items(%s, %s, %s, %s)', update_cards, update_sources, update_sinks, update_server)
-
-        # Remove all PA objects
-        if update_cards:
-            self.card_remove_all()
-        if update_sources:
-            self.source_remove_all()
-            self.source_output_remove_all()
-        if update_sinks:
-            self.sink_remove_all()
-            self.sink_input_remove_all()
+        steps = []
 
         # Cards
         if update_cards:
-            self.synchronise_op(
+            steps.append((
                 'pa_context_get_card_info_list()',
-                pa_context_get_card_info_list(self.pa_context, self._pacb_card_info, None))
+                lambda ctx, ud: pa_context_get_card_info_list(ctx, self._pacb_card_info, ud),
+                self.pa_reconcile_handler(self.cards, self.card_remove, self.card_info, self.card_rekey)))
 
         if update_sources:
             # Sources
-            self.synchronise_op(
+            steps.append((
                 'pa_context_get_source_info_list()',
-                pa_context_get_source_info_list(self.pa_context, self._pacb_source_info, None))
+                lambda ctx, ud: pa_context_get_source_info_list(ctx, self._pacb_source_info, ud),
+                self.pa_reconcile_handler(self.sources, self.source_remove, self.source_info, self.source_rekey)))
             # Source outputs
-            self.synchronise_op(
+            steps.append((
                 'pa_context_get_source_output_info_list()',
-                pa_context_get_source_output_info_list(self.pa_context, self._pacb_source_output_info, None))
+                lambda ctx, ud: pa_context_get_source_output_info_list(ctx, self._pacb_source_output_info, ud),
+                self.pa_reconcile_handler(self.source_outputs, self.source_output_remove, self.source_output_add)))
 
         if update_sinks:
             # Sinks
-            self.synchronise_op(
+            steps.append((
                 'pa_context_get_sink_info_list()',
-                pa_context_get_sink_info_list(self.pa_context, self._pacb_sink_info, None))
+                lambda ctx, ud: pa_context_get_sink_info_list(ctx, self._pacb_sink_info, ud),
+                self.pa_reconcile_handler(self.sinks, self.sink_remove, self.sink_info, self.sink_rekey)))
             # Sink inputs
-            self.synchronise_op(
+            steps.append((
                 'pa_context_get_sink_input_info_list()',
-                pa_context_get_sink_input_info_list(self.pa_context, self._pacb_sink_input_info, None))
+                lambda ctx, ud: pa_context_get_sink_input_info_list(ctx, self._pacb_sink_input_info, ud),
+                self.pa_reconcile_handler(self.sink_inputs, self.sink_input_remove, self.sink_input_add)))
 
         if update_server:
             # Server info
-            self.synchronise_op(
+            steps.append((
                 'pa_context_get_server_info()',
-                pa_context_get_server_info(self.pa_context, self._pacb_server_info, None))
+                lambda ctx, ud: pa_context_get_server_info(ctx, self._pacb_server_info, ud),
+                self.pa_results_handler(self.server_info)))
+
+        # Run the operations all at once, and accumulate the resulting menu changes until all of them are applied
+        self.menu_model.freeze('update_pa_items')
+        self.pa_ops.submit_group(steps, lambda group: self.update_pa_items_done(group, on_done), self.pa_op_timeout)
+
+    def update_pa_items_done(self, group, on_done: callable):
+        """Completion callback of update_pa_items()."""
+        logging.debug(
+            '.update_pa_items(): %d request(s) completed in %.3f ms%s',
+            len(group.ops), group.duration * 1000, '' if group.succeeded else ' with failures')
+        self.menu_model.commit()
+        if on_done is not None:
+            on_done(group)
+
+    def stream_needs_rebuild(self, stream, info: pa_info.StreamInfo) -> bool:
+        """Check whether an existing sink or source has to be recreated because its index now refers to a different
+        sink or source, it's moved to a different card, or the set of its ports has changed.
+        :param stream: existing Sink or Source instance
+        :param info: fresh info of the sink or source with the same index
+        :return: True if the stream has to be recreated
+        """
+        if stream.name != info.name or stream.card_index != info.card:
+            return True
+
+        # Virtual streams only have a dummy port
+        return \
+            not self.is_virtual_card(info.card) and \
+            stream.ports.keys() != {port_info.name for port_info in info.ports}
+
+    def virtual_stream_changed(self, stream, kind: str, section) -> bool:
+        """Check whether the configuration of a virtual sink or source no longer matches the stream's menu item.
+        :param stream: existing Sink or Source instance
+        :param kind: 'sinks' or 'sources'
+        :param section: menu section the stream belongs to, or None if the section is hidden
+        :return: True if the stream has to be recreated; always False for non-virtual streams
+        """
+        if not self.is_virtual_card(stream.card_index):
+            return False
+        stream_cfg = self.config_devices['virtual'][kind][stream.name]
+        is_visible = bool(stream_cfg['visible', True]) and section is not None
+        return \
+            stream.display_name != stream_cfg['name', ''] or \
+            any(port.menu_item is not None for port in stream.ports.values()) != is_visible
 
     @staticmethod
     def is_virtual_card(card_index: int) -> bool:
@@ -0,0 +1,232 @@
+"""
+Indicator menu model.
+"""
+import bisect
+import logging
+from contextlib import contextmanager
+
+from gi.repository import Gtk
+
+
+class MenuSection:
+    """Section of the indicator menu, consisting of a header item, radio items sorted by their keys, and a separator
+    item."""
+
+    def __init__(self, header, separator):
+        """Constructor.
+        :param header: header menu item of the section
+        :param separator: separator menu item terminating the section
+        """
+        self.header    = header
+        self.separator = separator
+        # -- Sort keys of the radio items in ascending order, and the items themselves in the same order
+        self.keys      = []
+        self.items     = []
+
+    def __len__(self) -> int:
+        """Number of menu items in the section, including the header and the separator."""
+        return len(self.items) + 2
+
+    def get_menu_items(self) -> list:
+        """Return all menu items of the section, in the order they appear in the menu."""
+        return [self.header] + self.items + [self.separator]
+
+    def get_group(self) -> list:
+        """Return the radio group the items of the section belong to."""
+        return self.items[0].get_group() if self.items else []
+
+    def add(self, key, item) -> int:
+        """Register an item, keeping the items sorted. Items with equal keys are kept in the order of addition.
+        :param key: sort key of the item
+        :param item: radio menu item
+        :return: index of the item within the section (the header being at index 0)
+        """
+        pos = bisect.bisect_right(self.keys, key)
+        self.keys.insert(pos, key)
+        self.items.insert(pos, item)
+        return pos + 1
+
+    def remove(self, key, item) -> bool:
+        """Unregister an item.
+        :param key: sort key the item has been registered with
+        :param item: radio menu item
+        :return: whether the item has been found
+        """
+        pos = bisect.bisect_left(self.keys, key)
+        while pos < len(self.keys) and self.keys[pos] == key:
+            if self.items[pos] is item:
+                del self.keys[pos]
+                del self.items[pos]
+                return True
+            pos += 1
+        return False
+
+
+class IndicatorMenu:
+    """Model of the indicator menu, made of sections and standalone items. It keeps track of the position of every
+    item, so that the underlying Gtk.Menu never has to be scanned.
+
+    Since the menu is exported over D-Bus, every item inserted into or removed from it results in a layout update
+    sent to the panel. Changes can therefore be batched using freeze() and commit() (or transaction()): while the menu
+    is frozen, only the model is updated, and the Gtk.Menu is brought in line with it once the outermost transaction
+    is committed.
+    """
+
+    def __init__(self, menu: Gtk.Menu):
+        """Constructor.
+        :param menu: the Gtk.Menu to manage
+        """
+        self.menu      = menu
+        # -- Total number of layout changes (item insertions and removals) applied to the Gtk.Menu
+        self.revisions = 0
+        # -- Top-level blocks in the order of appearance: MenuSection objects and standalone menu items
+        self._blocks   = []
+        # -- Radio item => (section, sort key)
+        self._keys     = {}
+        # -- Transaction nesting level and the name of the outermost transaction
+        self._frozen   = 0
+        self._tx_name  = None
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether changes are currently being accumulated instead of being applied to the Gtk.Menu."""
+        return self._frozen > 0
+
+    def freeze(self, name: str):
+        """Start a (possibly nested) transaction: accumulate changes until it's committed.
+        :param name: name of the transaction for logging purposes
+        """
+        if self._frozen == 0:
+            self._tx_name = name
+        self._frozen += 1
+
+    def commit(self) -> int:
+        """Finish a transaction started with freeze(). Once the outermost transaction is finished, apply all
+        accumulated changes to the Gtk.Menu in one go.
+        :return: number of layout changes applied
+        """
+        self._frozen -= 1
+        if self._frozen > 0:
+            return 0
+        count = self._sync()
+        logging.debug('.menu: transaction `%s` committed with %d layout revision(s)', self._tx_name, count)
+        self._tx_name = None
+        return count
+
+    @contextmanager
+    def transaction(self, name: str):
+        """Context manager wrapping a freeze()/commit() pair.
+        :param name: name of the transaction for logging purposes
+        """
+        self.freeze(name)
+        try:
+            yield self
+        finally:
+            self.commit()
+
+    def get_menu_items(self) -> list:
+        """Return all items of the menu model, in the order they appear in the menu."""
+        items = []
+        for block in self._blocks:
+            if isinstance(block, MenuSection):
+                items.extend(block.get_menu_items())
+            else:
+                items.append(block)
+        return items
+
+    def clear(self):
+        """Remove all items from the menu."""
+        self._blocks.clear()
+        self._keys.clear()
+        if not self.is_frozen:
+            for item in self.menu.get_children():
+                self._gtk_remove(item)
+
+    def append_item(self, item):
+        """Append a standalone item to the menu."""
+        self._blocks.append(item)
+        if not self.is_frozen:
+            self._gtk_append(item)
+
+    def append_section(self, header, separator) -> MenuSection:
+        """Append a new section to the menu.
+        :param header: header menu item of the section
+        :param separator: separator menu item terminating the section
+        :return: the created section
+        """
+        section = MenuSection(header, separator)
+        self._blocks.append(section)
+        if not self.is_frozen:
+            self._gtk_append(header)
+            self._gtk_append(separator)
+        return section
+
+    def insert_ordered_item(self, section: MenuSection, key, item):
+        """Insert a radio item into the given section, keeping the section's items sorted by their keys.
+        :param section: section to insert the item into
+        :param key: sort key of the item
+        :param item: radio menu item
+        """
+        idx = self._get_offset(section) + section.add(key, item)
+        self._keys[item] = (section, key)
+        if not self.is_frozen:
+            logging.debug('.menu: inserting item `%s` at index %d', item.get_label(), idx)
+            self._gtk_insert(item, idx)
+
+    def remove_item(self, item):
+        """Remove an item inserted by insert_ordered_item() from the menu."""
+        entry = self._keys.pop(item, None)
+        if entry is not None:
+            entry[0].remove(entry[1], item)
+        if not self.is_frozen:
+            self._gtk_remove(item)
+
+    def _get_offset(self, section: MenuSection) -> int:
+        """Return the index of the given section's header in the menu."""
+        offset = 0
+        for block in self._blocks:
+            if block is section:
+                return offset
+            offset += len(block) if isinstance(block, MenuSection) else 1
+        raise ValueError('Section is not part of the menu')
+
+    def _sync(self) -> int:
+        """Bring the Gtk.Menu in line with the model. Items present in both always retain their relative order, so
+        it's only necessary to drop the items missing from the model and to insert the new ones.
+        :return: number of layout changes applied
+        """
+        items = self.get_menu_items()
+        children = self.menu.get_children()
+        wanted = set(items)
+        present = set()
+        count = 0
+
+        # Remove items no longer in the model
+        for item in children:
+            if item in wanted:
+                present.add(item)
+            else:
+                self._gtk_remove(item)
+                count += 1
+
+        # Insert new items at their final positions, in ascending order
+        for idx, item in enumerate(items):
+            if item not in present:
+                self._gtk_insert(item, idx)
+                count += 1
+        return count
+
+    def _gtk_append(self, item):
+        """Append an item to the Gtk.Menu."""
+        self.revisions += 1
+        self.menu.append(item)
+
+    def _gtk_insert(self, item, idx: int):
+        """Insert an item into the Gtk.Menu."""
+        self.revisions += 1
+        self.menu.insert(item, idx)
+
+    def _gtk_remove(self, item):
+        """Remove an item from the Gtk.Menu."""
+        self.revisions += 1
+        self.menu.remove(item)
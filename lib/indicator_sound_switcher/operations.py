@@ -0,0 +1,329 @@
+"""
+Asynchronous PulseAudio operation management.
+"""
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from gi.repository import GLib
+
+from . import lib_pulseaudio
+
+
+class PAOperation:
+    """Handle of an asynchronous PulseAudio operation. Completion callbacks are always invoked on the GUI thread."""
+
+    # Operation states
+    PENDING   = 'pending'
+    DONE      = 'done'
+    FAILED    = 'failed'
+    CANCELLED = 'cancelled'
+    TIMED_OUT = 'timed out'
+
+    def __init__(self, manager, op_id: int, name: str):
+        """Constructor.
+        :param manager: PAOperationManager instance the operation belongs to
+        :param op_id:   unique ID of the operation, passed to PulseAudio as the callback's user data
+        :param name:    operation name for logging purposes
+        """
+        self.manager    = manager
+        self.id         = op_id
+        self.name       = name
+        self.state      = self.PENDING
+        # -- Data items delivered by the operation's callback, e.g. CardInfo objects
+        self.results    = []
+        # -- Monotonic time the operation has been submitted and finished at
+        self.started    = time.monotonic()
+        self.finished   = None
+
+        # PulseAudio's operation object and the ID of the deadline GLib source, if any
+        self.pa_op      = None
+        self.timeout_id = None
+        self._callbacks = []
+
+    @property
+    def is_done(self) -> bool:
+        """Whether the operation is finished, disregarding the outcome."""
+        return self.state != self.PENDING
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the operation has been completed successfully."""
+        return self.state == self.DONE
+
+    @property
+    def duration(self) -> float:
+        """Duration of the operation in seconds, up to now if it's still pending."""
+        return (self.finished or time.monotonic()) - self.started
+
+    def add_done_callback(self, callback: callable):
+        """Register a callback to be invoked with this operation once it's finished. If it's already finished, the
+        callback is invoked immediately.
+        """
+        if self.is_done:
+            callback(self)
+        else:
+            self._callbacks.append(callback)
+
+    def cancel(self):
+        """Cancel the operation, if it's still pending."""
+        self.manager.cancel(self)
+
+    def finish(self, state: str):
+        """Mark the operation finished and invoke the completion callbacks. Only to be called by the manager."""
+        self.state = state
+        self.finished = time.monotonic()
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception:
+                logging.exception('Completion callback of PulseAudio operation `%s` failed', self.name)
+
+
+class PAOperationGroup:
+    """Group of PulseAudio operations started all at once and finished together. Completion callbacks of the member
+    operations are deferred until all of them are finished, and then invoked in the order the operations were added.
+    """
+
+    def __init__(self, on_done: callable = None):
+        """Constructor.
+        :param on_done: optional callback receiving this group once all its operations are finished
+        """
+        self.ops        = []
+        self.on_done    = on_done
+        self.started    = time.monotonic()
+        self.finished   = None
+        self._handlers  = []
+        self._remaining = 0
+        self._sealed    = False
+
+    @property
+    def is_done(self) -> bool:
+        """Whether all operations in the group are finished."""
+        return self.finished is not None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether all operations in the group have been completed successfully."""
+        return all(op.succeeded for op in self.ops)
+
+    @property
+    def duration(self) -> float:
+        """Duration of the group in seconds, up to now if it's still pending."""
+        return (self.finished or time.monotonic()) - self.started
+
+    def add(self, op: PAOperation, on_done: callable = None):
+        """Add an operation to the group.
+        :param op: operation to add
+        :param on_done: optional callback receiving the operation once the whole group is finished
+        """
+        self.ops.append(op)
+        self._handlers.append(on_done)
+        self._remaining += 1
+        op.add_done_callback(self._op_done)
+
+    def seal(self):
+        """Signal that no more operations are going to be added to the group."""
+        self._sealed = True
+        self._check_done()
+
+    def _op_done(self, op: PAOperation):
+        """Member operation completion callback."""
+        self._remaining -= 1
+        self._check_done()
+
+    def _check_done(self):
+        """Finish the group once it's sealed and all its operations are finished."""
+        if not self._sealed or self._remaining > 0 or self.is_done:
+            return
+        self.finished = time.monotonic()
+
+        # Invoke the member operations' callbacks in order
+        for op, handler in zip(self.ops, self._handlers):
+            if handler is not None:
+                try:
+                    handler(op)
+                except Exception:
+                    logging.exception('Completion callback of PulseAudio operation `%s` failed', op.name)
+        if self.on_done is not None:
+            self.on_done(self)
+
+
+class PAOperationManager:
+    """Manager of asynchronous PulseAudio operations, which are started on the GUI thread and completed on the
+    PulseAudio one. The PulseAudio callbacks are supposed to report results and completion with the operation ID
+    received as user data; the manager then finishes the operation on the GUI thread.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self.mainloop = None
+        self.context  = None
+        self._ops       = {}  # ID => pending PAOperation
+        self._ids       = itertools.count(1)
+        self._lock      = threading.Lock()
+        # -- Completions reported by PulseAudio, awaiting the GUI thread: list of (operation ID, success) tuples
+        self._completed = []
+        # -- ID of the GLib source draining _completed, if it's scheduled
+        self._drain_id  = None
+
+    def attach(self, mainloop, context):
+        """Start using the given threaded mainloop and context for new operations."""
+        self.mainloop = mainloop
+        self.context  = context
+
+    def detach(self):
+        """Cancel all pending operations and stop using the current mainloop and context."""
+        self.cancel_all()
+        self.mainloop = None
+        self.context  = None
+
+    @contextmanager
+    def locked(self):
+        """Context manager holding the PulseAudio mainloop lock, which is required for calling any PulseAudio functions
+        from outside the PulseAudio thread.
+        """
+        lib_pulseaudio.pa_threaded_mainloop_lock(self.mainloop)
+        try:
+            yield
+        finally:
+            lib_pulseaudio.pa_threaded_mainloop_unlock(self.mainloop)
+
+    def submit(self, name: str, start: callable, on_done: callable = None, timeout_ms: int = None) -> PAOperation:
+        """Start an asynchronous PulseAudio operation.
+        :param name:       operation name for logging purposes
+        :param start:      function receiving the context and the user data to pass to the callback, which starts the
+                           PulseAudio operation and returns the pa_operation object
+        :param on_done:    optional callback receiving the PAOperation once it's finished, disregarding the outcome
+        :param timeout_ms: optional deadline for the operation in milliseconds; it's cancelled once exceeded
+        :return: PAOperation handle
+        """
+        op = PAOperation(self, next(self._ids), name)
+        if on_done is not None:
+            op.add_done_callback(on_done)
+
+        # Start the operation
+        pa_op = None
+        if self.context is not None:
+            with self._lock:
+                self._ops[op.id] = op
+            with self.locked():
+                pa_op = start(self.context, op.id)
+
+        # Fail the operation (later, so that callbacks are invoked consistently) if it couldn't be started
+        if not pa_op:
+            logging.error('PulseAudio operation failed: `%s`', name)
+            with self._lock:
+                self._ops[op.id] = op
+            self.complete(op.id, False)
+            return op
+
+        op.pa_op = pa_op
+        if timeout_ms:
+            op.timeout_id = GLib.timeout_add(timeout_ms, self._on_timeout, op)
+        return op
+
+    def submit_group(self, steps: list, on_done: callable = None, timeout_ms: int = None) -> PAOperationGroup:
+        """Start asynchronous PulseAudio operations all at once, so that they're pipelined by the daemon, and wait for
+        all of them to finish. Each operation's own completion callback is invoked only then, in the order of the steps.
+        :param steps:      list of (name, start, on_done) tuples, see submit()
+        :param on_done:    optional callback receiving the PAOperationGroup once all operations are finished
+        :param timeout_ms: optional deadline for each operation in milliseconds
+        :return: PAOperationGroup
+        """
+        group = PAOperationGroup(on_done)
+        for name, start, on_step_done in steps:
+            group.add(self.submit(name, start, None, timeout_ms), on_step_done)
+        group.seal()
+        return group
+
+    def add_result(self, op_id, item):
+        """Store a data item delivered for the operation with the given ID. Called on the PulseAudio thread."""
+        with self._lock:
+            op = self._ops.get(op_id)
+        if op is not None:
+            op.results.append(item)
+
+    def complete(self, op_id, success: bool):
+        """Signal the completion of the operation with the given ID. Can be called from any thread. Completions are
+        collected and finished on the GUI thread by a single GLib source, rather than by one per completion.
+        """
+        with self._lock:
+            self._completed.append((op_id, success))
+            if self._drain_id is None:
+                self._drain_id = GLib.idle_add(self._drain_completed)
+
+    def cancel(self, op: PAOperation, state: str = PAOperation.CANCELLED):
+        """Cancel the given operation, if it's still pending.
+        :param op: operation to cancel
+        :param state: final state of the operation, either CANCELLED or TIMED_OUT
+        """
+        with self._lock:
+            if self._ops.pop(op.id, None) is None:
+                return
+
+        # Cancel the operation within PulseAudio, if it's still running
+        if op.pa_op and self.mainloop is not None:
+            with self.locked():
+                if lib_pulseaudio.pa_operation_get_state(op.pa_op) == lib_pulseaudio.PA_OPERATION_RUNNING:
+                    lib_pulseaudio.pa_operation_cancel(op.pa_op)
+        self._finish(op, state)
+
+    def cancel_all(self):
+        """Cancel all pending operations."""
+        with self._lock:
+            ops = list(self._ops.values())
+        for op in ops:
+            self.cancel(op)
+
+    def _drain_completed(self) -> bool:
+        """Finish all operations whose completion has been reported so far. Always runs on the GUI thread."""
+        # Grab the completions, so that new ones can be collected while these are being processed
+        with self._lock:
+            completed = self._completed
+            self._completed = []
+            self._drain_id  = None
+
+        for op_id, success in completed:
+            with self._lock:
+                op = self._ops.pop(op_id, None)
+
+            # The operation may have been cancelled in the meantime
+            if op is not None:
+                self._finish(op, PAOperation.DONE if success else PAOperation.FAILED)
+
+        # Prevent this method from being called again
+        return False
+
+    def _on_timeout(self, op: PAOperation) -> bool:
+        """Cancel an operation whose deadline has been exceeded. Always runs on the GUI thread."""
+        op.timeout_id = None
+        logging.warning('PulseAudio operation `%s` timed out after %.3f s', op.name, op.duration)
+        self.cancel(op, PAOperation.TIMED_OUT)
+
+        # Prevent this method from being called again
+        return False
+
+    def _finish(self, op: PAOperation, state: str) -> bool:
+        """Release the resources held by the operation and mark it finished."""
+        if op.timeout_id is not None:
+            GLib.source_remove(op.timeout_id)
+            op.timeout_id = None
+
+        # Free the operation object
+        if op.pa_op:
+            if self.mainloop is not None:
+                with self.locked():
+                    lib_pulseaudio.pa_operation_unref(op.pa_op)
+            op.pa_op = None
+
+        if state == PAOperation.FAILED:
+            logging.warning('PulseAudio operation `%s` failed', op.name)
+        logging.debug('.operations: `%s` %s in %.3f ms', op.name, state, op.duration * 1000)
+        op.finish(state)
+
+        # Prevent this method from being called again (when used as an idle callback)
+        return False
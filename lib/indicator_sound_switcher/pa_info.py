@@ -0,0 +1,120 @@
+"""
+Plain Python snapshots of PulseAudio introspection structures.
+
+PulseAudio only guarantees the validity of the structures passed to an introspection callback for the duration of the
+callback, which runs on the PulseAudio thread. The functions below copy the data the indicator makes use of into
+immutable tuples, which can be safely passed on to the GUI thread.
+"""
+from collections import namedtuple
+
+from . import lib_pulseaudio
+
+# Card profile info
+ProfileInfo = namedtuple('ProfileInfo', 'name description num_sinks num_sources priority')
+
+# Card, sink or source port info. profiles is a tuple of supported profile names (empty for sink/source ports)
+PortInfo = namedtuple('PortInfo', 'name description priority is_available direction profiles')
+
+# Card info. active_profile is the name of the active profile or None, properties is a dict of the CARD_PROPERTIES
+# values (None for missing ones)
+CardInfo = namedtuple('CardInfo', 'index name driver active_profile profiles ports properties')
+
+# Sink or source info. active_port is the name of the active port or None
+StreamInfo = namedtuple('StreamInfo', 'index name description card active_port ports')
+
+# Sink input or source output info. stream is the index of the sink/source it's connected to, corked tells whether it's
+# paused
+StreamClientInfo = namedtuple('StreamClientInfo', 'index name stream corked')
+
+# Server info
+ServerInfo = namedtuple('ServerInfo', 'default_sink_name default_source_name')
+
+# Card properties to be copied from the card's property list
+CARD_PROPERTIES = ('device.description', 'device.vendor.name', 'device.product.name')
+
+
+def _decode(value) -> str:
+    """Decode a (possibly NULL) C string."""
+    return value.decode() if value else ''
+
+
+def _ports(pa_ports, direction: int = None) -> tuple:
+    """Copy a NULL-terminated array of pointers to card, sink or source port info structures.
+    :param pa_ports: the array to copy
+    :param direction: port direction (one of the PA_DIRECTION_* constants) for sink/source ports, None for card ports,
+                      which provide it themselves
+    """
+    ports = []
+    if pa_ports:
+        idx = 0
+        while True:
+            port_ptr = pa_ports[idx]
+            # NULL pointer terminates the array
+            if not port_ptr:
+                break
+            pa_port = port_ptr.contents
+            ports.append(PortInfo(
+                _decode(pa_port.name),
+                _decode(pa_port.description),
+                pa_port.priority,
+                pa_port.available != lib_pulseaudio.PA_PORT_AVAILABLE_NO,
+                pa_port.direction if direction is None else direction,
+                () if direction is not None else
+                tuple(_decode(pa_port.profiles[i].contents.name) for i in range(pa_port.n_profiles))))
+            idx += 1
+    return tuple(ports)
+
+
+def card_info_from_struct(data) -> CardInfo:
+    """Make a CardInfo from a pa_card_info structure."""
+    return CardInfo(
+        data.index,
+        _decode(data.name),
+        _decode(data.driver),
+        _decode(data.active_profile.contents.name) if data.active_profile else None,
+        tuple(
+            ProfileInfo(
+                _decode(p.name), _decode(p.description), p.n_sinks, p.n_sources, p.priority)
+            for p in (data.profiles[i] for i in range(data.n_profiles))),
+        _ports(data.ports),
+        {
+            name: _decode(lib_pulseaudio.pa_proplist_gets(data.proplist, name.encode())) or None
+            for name in CARD_PROPERTIES
+        })
+
+
+def sink_info_from_struct(data) -> StreamInfo:
+    """Make a StreamInfo from a pa_sink_info structure."""
+    return StreamInfo(
+        data.index,
+        _decode(data.name),
+        _decode(data.description),
+        data.card,
+        _decode(data.active_port.contents.name) if data.active_port else None,
+        _ports(data.ports, lib_pulseaudio.PA_DIRECTION_OUTPUT))
+
+
+def source_info_from_struct(data) -> StreamInfo:
+    """Make a StreamInfo from a pa_source_info structure."""
+    return StreamInfo(
+        data.index,
+        _decode(data.name),
+        _decode(data.description),
+        data.card,
+        _decode(data.active_port.contents.name) if data.active_port else None,
+        _ports(data.ports, lib_pulseaudio.PA_DIRECTION_INPUT))
+
+
+def sink_input_info_from_struct(data) -> StreamClientInfo:
+    """Make a StreamClientInfo from a pa_sink_input_info structure."""
+    return StreamClientInfo(data.index, _decode(data.name), data.sink, bool(data.corked))
+
+
+def source_output_info_from_struct(data) -> StreamClientInfo:
+    """Make a StreamClientInfo from a pa_source_output_info structure."""
+    return StreamClientInfo(data.index, _decode(data.name), data.source, bool(data.corked))
+
+
+def server_info_from_struct(data) -> ServerInfo:
+    """Make a ServerInfo from a pa_server_info structure."""
+    return ServerInfo(_decode(data.default_sink_name), _decode(data.default_source_name))
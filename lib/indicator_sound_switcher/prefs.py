@@ -14,6 +14,9 @@ class PreferencesDialog:
     # Preferences dialog singleton
     _dlg = None
 
+    # UI definition read from prefs.glade, kept once the dialog has been opened for the first time
+    _ui_definition = None
+
     @classmethod
     def show(cls, indicator):
         """Instantiate and run a Preferences dialog."""
@@ -29,6 +32,14 @@ class PreferencesDialog:
             finally:
                 cls._dlg = None
 
+    @classmethod
+    def get_ui_definition(cls) -> str:
+        """Return the dialog's UI definition, reading it in on the first call."""
+        if cls._ui_definition is None:
+            with open(os.path.join(os.path.dirname(__file__), 'prefs.glade'), 'r', encoding='utf-8') as f:
+                cls._ui_definition = f.read()
+        return cls._ui_definition
+
     @classmethod
     def quit(cls):
         """Close the Preferences dialog, is any."""
@@ -40,9 +51,9 @@ class PreferencesDialog:
         self.indicator = indicator
         self.refresh_timer = None
 
-        # Open and parse the XML UI file otherwise
+        # Parse the XML UI definition
         self.builder = Gtk.Builder()
-        self.builder.add_from_file(os.path.join(os.path.dirname(__file__), 'prefs.glade'))
+        self.builder.add_from_string(self.get_ui_definition())
 
         # Remove the 2-pixel "aura" around the notebook
         self.prefs_dialog.get_content_area().set_border_width(0)
@@ -304,6 +315,7 @@ class PreferencesDialog:
             if cnt > 0:
                 logging.debug('Config changed, saving')
                 self.indicator.config_save()
+                self.indicator.shortcuts.rebuild(self.indicator.config)
 
             pruned = True
 
@@ -417,9 +429,11 @@ class PreferencesDialog:
         if cfg is None:
             return
 
-        # Suspend the keyboard manager so that it doesn't interfere with key selection (in case the same key combination
-        # is reused)
-        self.indicator.keyboard_manager.suspend()
+        # Suspend the keyboard manager, if any, so that it doesn't interfere with key selection (in case the same key
+        # combination is reused)
+        keyboard_manager = self.indicator.keyboard_manager
+        if keyboard_manager is not None:
+            keyboard_manager.suspend()
 
         # Show a grab shortcut dialog
         dlg = KeyboardShortcutDialog(self._dlg.prefs_dialog)
@@ -427,7 +441,8 @@ class PreferencesDialog:
         dlg.destroy()
 
         # Restore the keyboard manager
-        self.indicator.keyboard_manager.resume()
+        if keyboard_manager is not None:
+            keyboard_manager.resume()
 
         # None means grabbing was canceled
         if shortcut is None:
@@ -442,9 +457,11 @@ class PreferencesDialog:
         if key_name == 'BackSpace':
             key_name = None
 
-        # Update the button and the port config
+        # Update the button, the port config and the shortcut index
         self.b_port_set_shortcut.set_label(key_name or _('(none)'))
         cfg['shortcut'] = key_name
+        self.indicator.shortcuts.set(
+            self.lbx_devices.get_selected_row().device_name, self.lbx_ports.get_selected_row().port_name, key_name)
 
         # Schedule a delayed setting refresh
         self.schedule_refresh()
@@ -0,0 +1,110 @@
+"""
+Startup time profiling.
+"""
+import logging
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """Collector of the durations of the startup phases and of the times startup milestones are reached at. All times
+    are measured relative to the moment the profiler has been created, i.e. when the application package is loaded.
+
+    Recording is cheap and therefore always on; the breakdown is only output if the profiler is enabled, once the
+    startup is finished.
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self.origin     = time.monotonic()
+        # -- Whether to output the breakdown once the startup is finished
+        self.enabled    = False
+        # -- Name of the file to write the breakdown to. If None, it's written to stderr
+        self.file_name  = None
+        # -- Whether the startup is finished
+        self.finished   = False
+        # -- Finished phases in the order of completion: list of (name, start, end) tuples
+        self.phases     = []
+        # -- Reached milestones in the order of occurrence: list of (name, time) tuples
+        self.milestones = []
+        # -- Phases in progress: name => start time
+        self._open      = {}
+
+    def now(self) -> float:
+        """Return the time elapsed since the profiler has been created, in seconds."""
+        return time.monotonic() - self.origin
+
+    def begin(self, name: str):
+        """Register the start of a phase. Does nothing once the startup is finished.
+        :param name: unique name of the phase
+        """
+        if not self.finished:
+            self._open[name] = self.now()
+
+    def end(self, name: str):
+        """Register the end of a phase. Does nothing if the phase isn't in progress.
+        :param name: name of the phase
+        """
+        start = self._open.pop(name, None)
+        if start is not None:
+            self.phases.append((name, start, self.now()))
+
+    @contextmanager
+    def phase(self, name: str):
+        """Context manager wrapping a begin()/end() pair.
+        :param name: unique name of the phase
+        """
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def mark(self, name: str):
+        """Register reaching a milestone. Does nothing once the startup is finished.
+        :param name: name of the milestone
+        """
+        if not self.finished:
+            self.milestones.append((name, self.now()))
+
+    def finish(self):
+        """Finish the startup, and output the breakdown if the profiler is enabled. Only the first call has any effect.
+        """
+        if self.finished:
+            return
+        self.mark('startup finished')
+        self.finished = True
+        logging.debug('.startup: finished in %.3f ms', self.now() * 1000)
+        if not self.enabled:
+            return
+
+        # Output the breakdown
+        text = '\n'.join(self.format_breakdown()) + '\n'
+        if self.file_name:
+            try:
+                with open(self.file_name, 'w') as f:
+                    f.write(text)
+            except OSError as e:
+                logging.error('Failed to write startup profile to %s: %s', self.file_name, e)
+        else:
+            sys.stderr.write(text)
+
+    def format_breakdown(self) -> list:
+        """Render the recorded phases and milestones, ordered by their start time (enclosing phases go first).
+        :return: list of text lines
+        """
+        entries = []
+        for name, start, end in self.phases:
+            # Indent nested phases
+            depth = sum(1 for n, s, e in self.phases if s <= start and end <= e and (s, e) != (start, end))
+            entries.append((start, start - end, '{:9.3f} ms {:9.3f} ms  {}{}'.format(
+                start * 1000, (end - start) * 1000, '  ' * depth, name)))
+        for name, at in self.milestones:
+            entries.append((at, 0, '{:9.3f} ms {:>12}  * {}'.format(at * 1000, '', name)))
+        entries.sort(key=lambda e: e[:2])
+        return ['Startup profile:', '{:>12} {:>12}  {}'.format('start', 'duration', 'phase')] + [e[2] for e in entries]
+
+
+# Profiler of the current process
+profiler = StartupProfiler()
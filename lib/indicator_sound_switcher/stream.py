@@ -29,11 +29,22 @@ class Stream(GObject.GObject):
         self.ports        = ports
         self.card_index   = card_index
         self._is_active   = False
+        # -- Fingerprint of the sink/source info the stream has last been updated with, see get_fingerprint()
+        self.fingerprint  = None
 
         # Assign every port's owner_stream
         for port in self.ports.values():
             port.owner_stream = self
 
+    @staticmethod
+    def get_fingerprint(info) -> tuple:
+        """Compute a fingerprint of PulseAudio sink or source info, consisting of only those properties the indicator
+        makes use of, so that changes irrelevant for it (such as volume changes) can be ignored.
+        :param info: StreamInfo object
+        :return: tuple (card index, active port name, ((port name, availability), ...))
+        """
+        return info.card, info.active_port, tuple((port.name, port.is_available) for port in info.ports)
+
     # Activates the specified port by its name
     def activate_port_by_name(self, name: str):
         for port in self.ports.values():
@@ -52,3 +63,38 @@ class Source(Stream):
 class Sink(Stream):
     """Sink class."""
     pass
+
+
+class StreamPortIndex:
+    """Index of sink and source ports by the card ports they correspond to, that is, by the card index, direction and
+    port name, so that a card port can be mapped to its stream without scanning all of them."""
+
+    def __init__(self):
+        """Constructor."""
+        # (card index, direction, port name) => list of (stream, stream port) tuples in the order of registration
+        self._entries = {}
+
+    def add_stream(self, stream: Stream):
+        """Register all ports of the given sink or source."""
+        for port in stream.ports.values():
+            self._entries.setdefault((stream.card_index, port.direction, port.name), []).append((stream, port))
+
+    def remove_stream(self, stream: Stream):
+        """Unregister all ports of the given sink or source."""
+        for port in stream.ports.values():
+            key = (stream.card_index, port.direction, port.name)
+            entries = [entry for entry in self._entries.get(key, []) if entry[0] is not stream]
+            if entries:
+                self._entries[key] = entries
+            else:
+                self._entries.pop(key, None)
+
+    def lookup(self, card_index: int, direction: int, port_name: str) -> tuple:
+        """Find a sink/source port that corresponds to the given card port.
+        :param card_index: index of the card the port belongs to
+        :param direction: port direction, one of the PA_DIRECTION_* constants
+        :param port_name: name of the port
+        :return: tuple containing the first registered matching stream (or None) and its port (or None)
+        """
+        entries = self._entries.get((card_index, direction, port_name))
+        return entries[0] if entries else (None, None)
@@ -0,0 +1,103 @@
+"""
+Coordination of port switch requests.
+"""
+import logging
+import time
+
+
+class PortSwitch:
+    """A single request to switch to a port or virtual stream."""
+
+    def __init__(self, target: tuple):
+        """Constructor.
+        :param target: what to switch to, as a (card index, port name or stream index) tuple
+        """
+        self.target    = target
+        # -- Monotonic time the switch has been requested at
+        self.requested = time.monotonic()
+
+    def get_latency(self) -> float:
+        """Return the time elapsed since the switch has been requested, in seconds."""
+        return time.monotonic() - self.requested
+
+
+class SwitchCoordinator:
+    """Makes sure there's only one port switch in progress at a time, and the latest request wins: requests arriving
+    while a switch is in progress (e.g. because a keyboard shortcut is being held down) are not queued up, instead
+    each of them supersedes the one waiting before it, and only the last one is carried out once the current switch is
+    complete. Requests identical to the switch in progress or the waiting one are dropped. Must only be used on the GUI
+    thread.
+
+    The switch in progress itself is never abandoned halfway: once a card profile switch has been requested, the card's
+    streams are being replaced, and the next switch can only be decided on once that's over.
+    """
+
+    def __init__(self, start: callable):
+        """Constructor.
+        :param start: callback receiving a PortSwitch that's to be carried out. Once the switch is complete (whether
+                      successfully or not), done() must be called with it
+        """
+        self.start      = start
+        # -- Switch in progress, if any
+        self.current    = None
+        # -- Latest request waiting for the current switch to complete, if any
+        self.waiting    = None
+        # -- Total number of dropped duplicate and superseded requests
+        self.duplicates = 0
+        self.superseded = 0
+
+    def request(self, target: tuple):
+        """Request a switch to the given target.
+        :param target: what to switch to, as a (card index, port name or stream index) tuple
+        """
+        # If nothing is in progress, switch right away
+        if self.current is None:
+            self._start(PortSwitch(target))
+            return
+
+        # Drop the request if it's going to be carried out anyway
+        latest = self.waiting or self.current
+        if latest.target == target:
+            self.duplicates += 1
+            logging.debug('.switcher: request for %s dropped as a duplicate', target)
+            return
+
+        # Drop the waiting request, if any, as it's superseded by this one
+        if self.waiting is not None:
+            self.superseded += 1
+            logging.info('Switch request for %s superseded by %s', self.waiting.target, target)
+            self.waiting = None
+
+            # If the request is for the switch in progress, that's all there's to do
+            if self.current.target == target:
+                return
+        self.waiting = PortSwitch(target)
+
+    def done(self, switch: PortSwitch):
+        """Register the completion of a switch, and start the waiting one, if any.
+        :param switch: PortSwitch passed to the start callback before. Completion of forgotten switches is ignored
+        """
+        if switch is not self.current:
+            return
+        logging.debug(
+            '.switcher: switch to %s completed in %.3f ms; %d duplicate(s), %d superseded in total',
+            switch.target, switch.get_latency() * 1000, self.duplicates, self.superseded)
+        self.current = None
+        self._start_waiting()
+
+    def clear(self):
+        """Forget about the switch in progress and the waiting one, if any."""
+        self.current = None
+        self.waiting = None
+
+    def _start(self, switch: PortSwitch):
+        """Carry out the given switch."""
+        self.current = switch
+        self.start(switch)
+
+    def _start_waiting(self):
+        """Carry out the waiting switch, if any."""
+        if self.waiting is not None:
+            switch = self.waiting
+            self.waiting = None
+            self._start(switch)
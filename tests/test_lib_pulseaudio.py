@@ -0,0 +1,95 @@
+"""
+Tests of the libpulse bindings: the functions declared in lib_pulseaudio must be exactly those the indicator calls, and
+must match the installed libpulse.
+
+Run with: python3 -m unittest discover -s tests
+"""
+import ctypes
+import ctypes.util
+import importlib.util
+import os.path
+import re
+import unittest
+
+# Package sources; lib_pulseaudio is loaded on its own, as importing the package requires Gtk
+LIB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'lib', 'indicator_sound_switcher')
+
+# Directory containing libpulse headers, used to validate the function prototypes
+PULSE_INCLUDE_DIR = '/usr/include/pulse'
+
+
+def load_bindings():
+    """Load the lib_pulseaudio module from the source tree."""
+    spec = importlib.util.spec_from_file_location('lib_pulseaudio', os.path.join(LIB_DIR, 'lib_pulseaudio.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_called_functions() -> set:
+    """Collect the names of the libpulse functions called from the package sources."""
+    names, methods = set(), set()
+    for file_name in os.listdir(LIB_DIR):
+        if file_name.endswith('.py') and file_name != 'lib_pulseaudio.py':
+            with open(os.path.join(LIB_DIR, file_name), 'r') as f:
+                text = f.read()
+            names.update(re.findall(r'(?<![\w.])(?:lib_pulseaudio\.)?(pa_\w+)\(', text))
+            methods.update(re.findall(r'def (pa_\w+)', text))
+
+    # Skip the indicator's own pa_* methods and callback types (pa_*_t)
+    return {name for name in names - methods if not name.endswith('_t')}
+
+
+def get_header_arg_counts() -> dict:
+    """Parse the libpulse headers for the number of arguments of every function.
+    :return: dict: function name => number of arguments
+    """
+    counts = {}
+    for file_name in os.listdir(PULSE_INCLUDE_DIR):
+        if file_name.endswith('.h'):
+            with open(os.path.join(PULSE_INCLUDE_DIR, file_name), 'r') as f:
+                text = re.sub(r'/\*.*?\*/', '', f.read(), flags=re.S)
+            for name, args in re.findall(r'\b(pa_\w+)\s*\(([^()]*(?:\([^()]*\)[^()]*)*)\)\s*(?:PA_GCC_\w+\s*)*;', text):
+                args = args.strip()
+                counts[name] = 0 if args in ('', 'void') else args.count(',') + 1
+    return counts
+
+
+class LibPulseaudioTest(unittest.TestCase):
+    """Tests of the lib_pulseaudio module."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.lib = load_bindings()
+
+    def test_declared_functions_match_calls(self):
+        """Every function called is declared, and every declared function is called."""
+        self.assertEqual(set(self.lib._functions), get_called_functions())
+
+    def test_prototypes_are_ctypes(self):
+        """Return and argument types of every function are ctypes types."""
+        for name, func in self.lib._functions.items():
+            with self.subTest(name=name):
+                self.assertEqual(func.name, name)
+                self.assertTrue(func.restype is None or hasattr(func.restype, 'from_param'))
+                self.assertIsInstance(func.argtypes, list)
+                for argtype in func.argtypes:
+                    self.assertTrue(hasattr(argtype, 'from_param'), argtype)
+
+    @unittest.skipUnless(ctypes.util.find_library('pulse'), 'libpulse is not installed')
+    def test_resolve_all(self):
+        """All declared functions are present in the installed libpulse."""
+        self.assertEqual(self.lib.resolve_all(), [])
+
+    @unittest.skipUnless(os.path.isdir(PULSE_INCLUDE_DIR), 'libpulse headers are not installed')
+    def test_argument_counts_match_headers(self):
+        """Every declared function takes as many arguments as its prototype in the libpulse headers."""
+        counts = get_header_arg_counts()
+        for name, func in self.lib._functions.items():
+            with self.subTest(name=name):
+                self.assertIn(name, counts)
+                self.assertEqual(len(func.argtypes), counts[name])
+
+
+if __name__ == '__main__':
+    unittest.main()